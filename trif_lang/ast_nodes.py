@@ -5,17 +5,17 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Module(Node):
     body: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportFrom(Node):
     module: str
     names: List[tuple[str, str]]
@@ -23,13 +23,13 @@ class ImportFrom(Node):
     namespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Import(Node):
     module: str
     alias: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Let(Node):
     name: str
     value: "Expression"
@@ -38,13 +38,13 @@ class Let(Node):
     is_default: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Assign(Node):
     target: "Expression"
     value: "Expression"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDef(Node):
     name: str
     params: List[str]
@@ -53,108 +53,108 @@ class FunctionDef(Node):
     is_default: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportNames(Node):
     names: List[tuple[str, str]]
     source: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportDefault(Node):
     value: "Expression"
 
 
-@dataclass
+@dataclass(slots=True)
 class Return(Node):
     value: Optional["Expression"]
 
 
-@dataclass
+@dataclass(slots=True)
 class If(Node):
     test: "Expression"
     body: List[Node]
     orelse: List[Node] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class While(Node):
     test: "Expression"
     body: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class For(Node):
     target: str
     iterator: "Expression"
     body: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class Spawn(Node):
     call: "Call"
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Node):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Name(Expression):
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Number(Expression):
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class String(Expression):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Boolean(Expression):
     value: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Null(Expression):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expression):
     left: Expression
     op: str
     right: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
     op: str
     operand: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Expression):
     func: Expression
     args: List[Expression]
 
 
-@dataclass
+@dataclass(slots=True)
 class Attribute(Expression):
     value: Expression
     attr: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListLiteral(Expression):
     elements: List[Expression]
 
 
-@dataclass
+@dataclass(slots=True)
 class DictLiteral(Expression):
     pairs: List[tuple[Expression, Expression]]
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import os
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -13,6 +15,32 @@ from .ast_nodes import Module
 from .codegen import PythonGenerator, JavaScriptGenerator
 from .optimizer import Optimizer
 
+# Oldest entries beyond this many are evicted from an AST cache directory.
+AST_CACHE_MAX_ENTRIES = 1024
+
+
+def _hash_sources(*names: str) -> bytes:
+    """Return a digest of the named modules in this package, read once at import."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        for name in names:
+            digest.update(Path(__file__).with_name(name).read_bytes())
+    except OSError:
+        # Sources that cannot be read (e.g. a zipped install) must never match
+        # an existing cache entry, so fall back to a per-process value.
+        digest.update(os.urandom(16))
+    return digest.digest()
+
+
+# Changes whenever the lexer, parser, or AST node layout changes so stale cache
+# entries are never unpickled into an incompatible tree.
+AST_CACHE_VERSION = b"trif-ast-" + _hash_sources("lexer.py", "parser.py", "ast_nodes.py")
+# Covers everything that shapes generated code, for caches of compiled output.
+CODEGEN_CACHE_VERSION = b"trif-codegen-" + _hash_sources(
+    "lexer.py", "parser.py", "ast_nodes.py", "optimizer.py", "codegen.py", "compiler.py"
+)
+
 
 @dataclass
 class CompileResult:
@@ -25,12 +53,33 @@ class CompileResult:
 class Compiler:
     """High level interface around parsing, optimisation, and code generation."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, cache_dir: Path | None = None) -> None:
         self.optimizer = Optimizer()
+        self.cache_dir = cache_dir
+
+    def parse_source(self, source: str) -> Module:
+        """Return the AST for *source*, consulting the on-disk cache when enabled."""
+
+        if self.cache_dir is None:
+            return parser.parse(lexer.tokenize(source))
+        key = hashlib.blake2b(source.encode("utf-8"), key=AST_CACHE_VERSION).hexdigest()
+        cache_path = self.cache_dir / key
+        try:
+            with cache_path.open("rb") as fh:
+                module = pickle.load(fh)
+            # Hits refresh the mtime so eviction drops the least recently used.
+            os.utime(cache_path)
+            return module
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            cache_path.unlink(missing_ok=True)
+        module = parser.parse(lexer.tokenize(source))
+        self._store_cached_module(cache_path, module)
+        return module
 
     def compile_source(self, source: str, target: str = "python", *, optimize: bool = True) -> str | bytes:
-        tokens = lexer.tokenize(source)
-        module = parser.parse(tokens)
+        module = self.parse_source(source)
         if optimize:
             module = self.optimizer.optimize(module)
         if target == "python":
@@ -59,6 +108,37 @@ class Compiler:
         decrypted = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
         return decrypted.decode("utf-8")
 
+    def _store_cached_module(self, cache_path: Path, module: Module) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("wb") as fh:
+                pickle.dump(module, fh, protocol=5)
+            os.replace(tmp_path, cache_path)
+            self._prune_cache(cache_path.parent)
+        except OSError:
+            # The cache is an optimisation only; a read-only home directory
+            # must never break compilation.
+            return
+
+    def _prune_cache(self, directory: Path) -> None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+        if len(entries) <= AST_CACHE_MAX_ENTRIES:
+            return
+        mtimes = []
+        for entry in entries:
+            try:
+                mtimes.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                continue
+        mtimes.sort()
+        for _, path in mtimes[: len(mtimes) - AST_CACHE_MAX_ENTRIES]:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+
     def _to_bytecode(self, module: Module) -> bytes:
         python_code = PythonGenerator().generate(module)
         return python_code.encode("utf-8")
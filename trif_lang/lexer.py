@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from typing import List
 
@@ -29,6 +30,33 @@ TOKEN_SPECIFICATION = [
 
 TOKEN_RE = re.compile("|".join(f"(?P<{name}>{regex})" for name, regex in TOKEN_SPECIFICATION), re.DOTALL)
 
+# Operator category bits, computed once per OP token so each precedence level
+# in the parser tests membership with a single bitwise AND.
+OP_TERM = 1 << 0
+OP_FACTOR = 1 << 1
+OP_COMPARISON = 1 << 2
+OP_EQUALITY = 1 << 3
+OP_AND = 1 << 4
+OP_OR = 1 << 5
+OP_UNARY = 1 << 6
+
+OP_MASKS = {
+    "+": OP_TERM,
+    "-": OP_TERM | OP_UNARY,
+    "*": OP_FACTOR,
+    "/": OP_FACTOR,
+    "%": OP_FACTOR,
+    "<": OP_COMPARISON,
+    ">": OP_COMPARISON,
+    "<=": OP_COMPARISON,
+    ">=": OP_COMPARISON,
+    "==": OP_EQUALITY,
+    "!=": OP_EQUALITY,
+    "&&": OP_AND,
+    "||": OP_OR,
+    "!": OP_UNARY,
+}
+
 KEYWORDS = {
     "let",
     "fn",
@@ -51,6 +79,12 @@ KEYWORDS = {
     "spawn",
 }
 
+# Token types are interned so the parser's comparisons against string
+# literals (which CPython interns) short-circuit on identity, and dispatch
+# dict probes hit the cached hash of the same object.
+TOKEN_TYPES = {name: sys.intern(name) for name, _ in TOKEN_SPECIFICATION}
+KEYWORD_TYPES = {keyword: sys.intern(keyword.upper()) for keyword in KEYWORDS}
+
 
 @dataclass
 class Token:
@@ -58,6 +92,7 @@ class Token:
     value: str
     line: int
     column: int
+    op_mask: int = 0
 
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
         return f"Token({self.type}, {self.value!r}, {self.line}, {self.column})"
@@ -72,7 +107,7 @@ def tokenize(source: str) -> List[Token]:
         match = TOKEN_RE.match(source, index)
         if not match:
             raise SyntaxError(f"Unexpected character {source[index]!r} at line {line} column {column}")
-        kind = match.lastgroup
+        kind = TOKEN_TYPES[match.lastgroup]
         value = match.group()
         if kind == "NEWLINE":
             tokens.append(Token("NEWLINE", value, line, column))
@@ -88,11 +123,15 @@ def tokenize(source: str) -> List[Token]:
             else:
                 column += len(value)
         else:
-            if kind == "NAME" and value in KEYWORDS:
-                kind = value.upper()
+            if kind == "NAME" and value in KEYWORD_TYPES:
+                kind = KEYWORD_TYPES[value]
             if kind == "STRING":
                 value = bytes(value[1:-1], "utf-8").decode("unicode_escape")
-            tokens.append(Token(kind, value, line, column))
+                tokens.append(Token(kind, value, line, column))
+            elif kind == "OP":
+                tokens.append(Token(kind, value, line, column, OP_MASKS.get(value, 0)))
+            else:
+                tokens.append(Token(kind, value, line, column))
             column += len(match.group())
         index = match.end()
     tokens.append(Token("EOF", "", line, column))
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Set, Tuple
 from urllib.parse import urljoin, urlparse
 from urllib.request import urlopen
 
@@ -16,8 +17,79 @@ from .compiler import Compiler
 CONFIG_ROOT = Path.home() / ".trif"
 LOCAL_REGISTRY = CONFIG_ROOT / "registry"
 CONFIG_PATH = CONFIG_ROOT / "config.json"
+AST_CACHE = CONFIG_ROOT / "ast-cache"
 OFFLINE_REGISTRY = Path(__file__).resolve().parent.parent / "registry" / "offline"
 
+_INIT_TPL = (
+    b"import importlib\n"
+    b"_entry = importlib.import_module('.%s', __name__)\n"
+    b"_exports = getattr(_entry, '__trif_exports__', {})\n"
+    b"__all__ = list(_exports.keys())\n"
+    b"globals().update(_exports)\n"
+    b"default = getattr(_entry, '__trif_default_export__', None)\n"
+)
+
+
+def _walk_files(root: Path) -> List[Path]:
+    """Return every regular file below *root* using a single directory walk."""
+
+    files: List[Path] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append(Path(entry.path))
+    return files
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard link *src* to *dst*, falling back to a real copy across devices.
+
+    Destinations that already match the source (same inode, or same size and
+    modification time) are left untouched so re-installs only replace files
+    that actually changed.
+    """
+
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        src_stat = os.stat(src)
+        if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+            return
+        if (dst_stat.st_size, dst_stat.st_mtime_ns) == (src_stat.st_size, src_stat.st_mtime_ns):
+            return
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _sync_tree(source: Path, target: Path) -> None:
+    """Mirror *source* into *target* without rewriting unchanged files."""
+
+    stale: Set[Path] = set(_walk_files(target)) if target.is_dir() else set()
+
+    def copy_function(src: str, dst: str) -> None:
+        _link_or_copy(src, dst)
+        stale.discard(Path(dst))
+
+    shutil.copytree(source, target, copy_function=copy_function, dirs_exist_ok=True)
+    for path in stale:
+        path.unlink()
+
+
+def _write_generated(path: Path, data: bytes) -> None:
+    # Installed sources may be hard links into the package origin, so never
+    # truncate an existing file in place.
+    path.unlink(missing_ok=True)
+    path.write_bytes(data)
+
 
 class PackageManager:
     """Manage Trif packages with a workflow similar to npm."""
@@ -28,7 +100,7 @@ class PackageManager:
         self.pkg_dir.mkdir(parents=True, exist_ok=True)
         CONFIG_ROOT.mkdir(parents=True, exist_ok=True)
         LOCAL_REGISTRY.mkdir(parents=True, exist_ok=True)
-        self.compiler = Compiler()
+        self.compiler = Compiler(cache_dir=AST_CACHE)
         self.registry_url = registry_url or self._load_registry_url()
         self._registry_cache: Dict[str, Any] | None = None
 
@@ -79,9 +151,8 @@ class PackageManager:
         package_root.mkdir(parents=True, exist_ok=True)
         archive_path = package_root / "package.zip"
         with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file in path.rglob("*"):
-                if file.is_file():
-                    zf.write(file, file.relative_to(path))
+            for file in _walk_files(path):
+                zf.write(file, file.relative_to(path))
         manifest_path = package_root / "package.json"
         manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
         self._update_local_index(manifest["name"], manifest["version"], archive_path)
@@ -144,30 +215,22 @@ class PackageManager:
                 f"Expected package {expected_name} but manifest contains {manifest['name']}"
             )
         target = self.pkg_dir / manifest["name"]
-        if target.exists():
-            shutil.rmtree(target)
-        shutil.copytree(source, target)
+        if target.exists() and not target.is_dir():
+            target.unlink()
+        _sync_tree(source, target)
         self._compile_package(target, manifest)
         self._write_lock(manifest["name"], manifest["version"])
         print(f"Installed {manifest['name']}@{manifest['version']}")
 
     def _compile_package(self, package_dir: Path, manifest: Dict[str, Any]) -> None:
-        trif_files = list(package_dir.rglob("*.trif"))
+        trif_files = [file for file in _walk_files(package_dir) if file.suffix == ".trif"]
         for trif_file in trif_files:
             code = self.compiler.compile_file(trif_file, target="python")
-            trif_file.with_suffix(".py").write_text(code, encoding="utf-8")
+            _write_generated(trif_file.with_suffix(".py"), code.encode("utf-8"))
         entry = Path(manifest.get("entry", "index.trif"))
         entry_module = ".".join(entry.with_suffix("").parts)
         init_path = package_dir / "__init__.py"
-        init_lines = [
-            "import importlib",
-            f"_entry = importlib.import_module('.{entry_module}', __name__)",
-            "_exports = getattr(_entry, '__trif_exports__', {})",
-            "__all__ = list(_exports.keys())",
-            "globals().update(_exports)",
-            "default = getattr(_entry, '__trif_default_export__', None)",
-        ]
-        init_path.write_text("\n".join(init_lines) + "\n", encoding="utf-8")
+        _write_generated(init_path, _INIT_TPL % entry_module.encode("utf-8"))
 
     def _write_lock(self, name: str, version: str) -> None:
         lock_path = self.project_root / "trif.lock.json"
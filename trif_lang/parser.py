@@ -1,7 +1,7 @@
 """Recursive descent parser for the Trif language."""
 from __future__ import annotations
 
-from typing import List, Sequence
+from typing import Dict, List, Sequence
 
 from .ast_nodes import (
     Assign,
@@ -30,27 +30,59 @@ from .ast_nodes import (
     UnaryOp,
     While,
 )
-from .lexer import Token
+from .lexer import (
+    OP_AND,
+    OP_COMPARISON,
+    OP_EQUALITY,
+    OP_FACTOR,
+    OP_OR,
+    OP_TERM,
+    OP_UNARY,
+    Token,
+)
+
+_ASSIGN_TARGETS = (Name, Attribute)
+
+# Binding power of each binary operator category; higher binds tighter and
+# every level is left associative.
+_BINARY_PRECEDENCE = {
+    OP_OR: 1,
+    OP_AND: 2,
+    OP_EQUALITY: 3,
+    OP_COMPARISON: 4,
+    OP_TERM: 5,
+    OP_FACTOR: 6,
+}
 
 
 class Parser:
+    # Fixed attribute layout: ``tokens`` and ``index`` are read on every
+    # token, and slot descriptors avoid the instance ``__dict__`` probe.
+    __slots__ = ("tokens", "index", "_names", "_strings")
+
     def __init__(self, tokens: Sequence[Token]):
-        self.tokens = tokens
+        # A tuple gives the hot loops below a fixed-size sequence that can be
+        # bound to a local and indexed without further attribute lookups.
+        self.tokens: tuple[Token, ...] = tuple(tokens)
         self.index = 0
+        # Identifier and string literal nodes are shared within one parse;
+        # AST nodes are never mutated after construction.
+        self._names: Dict[str, Name] = {}
+        self._strings: Dict[str, String] = {}
 
     @property
     def current(self) -> Token:
         return self.tokens[self.index]
 
     def consume(self, expected: str | None = None) -> Token:
-        token = self.current
+        token = self.tokens[self.index]
         if expected and token.type != expected:
             raise SyntaxError(f"Expected {expected} but got {token.type} at line {token.line}")
         self.index += 1
         return token
 
     def match(self, *types: str) -> bool:
-        if self.current.type in types:
+        if self.tokens[self.index].type in types:
             self.index += 1
             return True
         return False
@@ -67,90 +99,91 @@ class Parser:
         return ".".join(parts)
 
     def parse(self) -> Module:
+        tokens = self.tokens
         body: List = []
-        while self.current.type != "EOF":
-            if self.current.type in {"NEWLINE", "SEMICOLON"}:
-                self.consume()
+        while True:
+            kind = tokens[self.index].type
+            if kind == "EOF":
+                break
+            if kind in {"NEWLINE", "SEMICOLON"}:
+                self.index += 1
                 continue
             body.append(self.parse_statement())
         return Module(body)
 
     def parse_block(self) -> List:
         self.consume("LBRACE")
+        tokens = self.tokens
         body: List = []
-        while self.current.type != "RBRACE":
-            if self.current.type in {"NEWLINE", "SEMICOLON"}:
-                self.consume()
+        while True:
+            kind = tokens[self.index].type
+            if kind == "RBRACE":
+                break
+            if kind in {"NEWLINE", "SEMICOLON"}:
+                self.index += 1
                 continue
             body.append(self.parse_statement())
         self.consume("RBRACE")
         return body
 
     def parse_statement(self):
-        tok = self.current
-        if tok.type == "IMPORT":
-            stmt = self.parse_import_statement()
-            self.optional_newline()
-            return stmt
-        if tok.type == "EXPORT":
-            stmt = self.parse_export_statement()
-            self.optional_newline()
-            return stmt
-        if tok.type in {"LET", "CONST"}:
-            mutable = tok.type == "LET"
-            self.consume()
-            stmt = self.parse_variable_statement(mutable=mutable)
-            self.optional_newline()
-            return stmt
-        if tok.type in {"FN", "FUNCTION"}:
-            stmt = self.parse_function_statement()
-            self.optional_newline()
-            return stmt
-        if tok.type == "RETURN":
-            self.consume()
-            if self.current.type not in {"NEWLINE", "RBRACE", "EOF"}:
-                value = self.parse_expression()
-            else:
-                value = None
-            self.optional_newline()
-            return Return(value)
-        if tok.type == "IF":
-            self.consume()
-            test = self.parse_expression()
-            body = self.parse_block()
-            orelse: List = []
-            if self.match("ELSE"):
-                orelse = self.parse_block()
-            self.optional_newline()
-            return If(test, body, orelse)
-        if tok.type == "WHILE":
-            self.consume()
-            test = self.parse_expression()
-            body = self.parse_block()
-            self.optional_newline()
-            return While(test, body)
-        if tok.type == "FOR":
-            self.consume()
-            target = self.consume("NAME").value
-            self.consume("IN")
-            iterator = self.parse_expression()
-            body = self.parse_block()
-            self.optional_newline()
-            return For(target, iterator, body)
-        if tok.type == "SPAWN":
-            self.consume()
-            call_expr = self.parse_expression()
-            if not isinstance(call_expr, Call):
-                raise SyntaxError("spawn expects a function call")
-            self.optional_newline()
-            return Spawn(call_expr)
+        handler = self._statement_handlers.get(self.tokens[self.index].type)
+        if handler is None:
+            stmt = self.parse_expression_statement()
+        else:
+            stmt = handler(self)
+        self.optional_newline()
+        return stmt
+
+    def parse_declaration_statement(self) -> Let:
+        mutable = self.consume().type == "LET"
+        return self.parse_variable_statement(mutable=mutable)
+
+    def parse_return_statement(self) -> Return:
+        self.consume("RETURN")
+        if self.current.type not in {"NEWLINE", "RBRACE", "EOF"}:
+            value = self.parse_expression()
+        else:
+            value = None
+        return Return(value)
+
+    def parse_if_statement(self) -> If:
+        self.consume("IF")
+        test = self.parse_expression()
+        body = self.parse_block()
+        orelse: List = []
+        if self.match("ELSE"):
+            orelse = self.parse_block()
+        return If(test, body, orelse)
+
+    def parse_while_statement(self) -> While:
+        self.consume("WHILE")
+        test = self.parse_expression()
+        body = self.parse_block()
+        return While(test, body)
+
+    def parse_for_statement(self) -> For:
+        self.consume("FOR")
+        target = self.consume("NAME").value
+        self.consume("IN")
+        iterator = self.parse_expression()
+        body = self.parse_block()
+        return For(target, iterator, body)
+
+    def parse_spawn_statement(self) -> Spawn:
+        self.consume("SPAWN")
+        call_expr = self.parse_expression()
+        if not isinstance(call_expr, Call):
+            raise SyntaxError("spawn expects a function call")
+        return Spawn(call_expr)
+
+    def parse_expression_statement(self):
         expr = self.parse_expression()
-        if isinstance(expr, (Name, Attribute)) and self.current.type == "OP" and self.current.value == "=":
+        tok = self.tokens[self.index]
+        if isinstance(expr, _ASSIGN_TARGETS) and tok.type == "OP" and tok.value == "=":
             self.consume("OP")
             value = self.parse_expression()
-            self.optional_newline()
             return Assign(expr, value)
-        self.optional_newline()
         return expr
 
     def parse_import_statement(self):
@@ -291,80 +324,50 @@ class Parser:
         return FunctionDef(name, params, body, exported=exported, is_default=is_default)
 
     def optional_newline(self) -> None:
-        while self.current.type in {"NEWLINE", "SEMICOLON"}:
-            self.consume()
+        tokens = self.tokens
+        while tokens[self.index].type in {"NEWLINE", "SEMICOLON"}:
+            self.index += 1
 
     def parse_expression(self) -> Expression:
-        return self.parse_or()
-
-    def parse_or(self) -> Expression:
-        expr = self.parse_and()
-        while self.current.type == "OP" and self.current.value == "||":
-            op = self.consume("OP").value
-            right = self.parse_and()
-            expr = BinaryOp(expr, op, right)
-        return expr
+        return self.parse_binary()
 
-    def parse_and(self) -> Expression:
-        expr = self.parse_equality()
-        while self.current.type == "OP" and self.current.value == "&&":
-            op = self.consume("OP").value
-            right = self.parse_equality()
-            expr = BinaryOp(expr, op, right)
-        return expr
-
-    def parse_equality(self) -> Expression:
-        expr = self.parse_comparison()
-        while self.current.type == "OP" and self.current.value in {"==", "!="}:
-            op = self.consume("OP").value
-            right = self.parse_comparison()
-            expr = BinaryOp(expr, op, right)
-        return expr
-
-    def parse_comparison(self) -> Expression:
-        expr = self.parse_term()
-        while self.current.type == "OP" and self.current.value in {"<", ">", "<=", ">="}:
-            op = self.consume("OP").value
-            right = self.parse_term()
-            expr = BinaryOp(expr, op, right)
-        return expr
-
-    def parse_term(self) -> Expression:
-        expr = self.parse_factor()
-        while self.current.type == "OP" and self.current.value in {"+", "-"}:
-            op = self.consume("OP").value
-            right = self.parse_factor()
-            expr = BinaryOp(expr, op, right)
-        return expr
-
-    def parse_factor(self) -> Expression:
+    def parse_binary(self, min_precedence: int = 1) -> Expression:
+        tokens = self.tokens
         expr = self.parse_unary()
-        while self.current.type == "OP" and self.current.value in {"*", "/", "%"}:
-            op = self.consume("OP").value
-            right = self.parse_unary()
-            expr = BinaryOp(expr, op, right)
+        tok = tokens[self.index]
+        precedence = _BINARY_PRECEDENCE.get(tok.op_mask & ~OP_UNARY, 0)
+        while precedence >= min_precedence:
+            self.index += 1
+            right = self.parse_binary(precedence + 1)
+            expr = BinaryOp(expr, tok.value, right)
+            tok = tokens[self.index]
+            precedence = _BINARY_PRECEDENCE.get(tok.op_mask & ~OP_UNARY, 0)
         return expr
 
     def parse_unary(self) -> Expression:
-        if self.current.type == "OP" and self.current.value in {"-", "!"}:
+        if self.tokens[self.index].op_mask & OP_UNARY:
             op = self.consume("OP").value
             operand = self.parse_unary()
             return UnaryOp(op, operand)
         return self.parse_call_expression()
 
     def parse_call_expression(self) -> Expression:
+        tokens = self.tokens
         expr = self.parse_primary()
         while True:
-            if self.match("LPAREN"):
+            kind = tokens[self.index].type
+            if kind == "LPAREN":
+                self.index += 1
                 args: List[Expression] = []
-                if self.current.type != "RPAREN":
+                if tokens[self.index].type != "RPAREN":
                     while True:
                         args.append(self.parse_expression())
                         if not self.match("COMMA"):
                             break
                 self.consume("RPAREN")
                 expr = Call(expr, args)
-            elif self.match("DOT"):
+            elif kind == "DOT":
+                self.index += 1
                 attr = self.consume("NAME").value
                 expr = Attribute(expr, attr)
             else:
@@ -372,32 +375,39 @@ class Parser:
         return expr
 
     def parse_primary(self) -> Expression:
-        tok = self.current
-        if tok.type == "NUMBER":
-            self.consume()
+        tok = self.tokens[self.index]
+        kind = tok.type
+        if kind == "NAME":
+            self.index += 1
+            name_node = self._names.get(tok.value)
+            if name_node is None:
+                name_node = self._names[tok.value] = Name(tok.value)
+            return name_node
+        if kind == "NUMBER":
+            self.index += 1
             return Number(float(tok.value))
-        if tok.type == "STRING":
-            self.consume()
-            return String(tok.value)
-        if tok.type == "TRUE":
-            self.consume()
+        if kind == "STRING":
+            self.index += 1
+            string_node = self._strings.get(tok.value)
+            if string_node is None:
+                string_node = self._strings[tok.value] = String(tok.value)
+            return string_node
+        if kind == "TRUE":
+            self.index += 1
             return Boolean(True)
-        if tok.type == "FALSE":
-            self.consume()
+        if kind == "FALSE":
+            self.index += 1
             return Boolean(False)
-        if tok.type == "NULL":
-            self.consume()
+        if kind == "NULL":
+            self.index += 1
             return Null()
-        if tok.type == "NAME":
-            self.consume()
-            return Name(tok.value)
-        if tok.type == "LPAREN":
-            self.consume()
+        if kind == "LPAREN":
+            self.index += 1
             expr = self.parse_expression()
             self.consume("RPAREN")
             return expr
-        if tok.type == "LBRACKET":
-            self.consume()
+        if kind == "LBRACKET":
+            self.index += 1
             elements: List[Expression] = []
             if self.current.type != "RBRACKET":
                 while True:
@@ -406,9 +416,9 @@ class Parser:
                         break
             self.consume("RBRACKET")
             return ListLiteral(elements)
-        if tok.type == "LBRACE":
+        if kind == "LBRACE":
             # dictionary literal
-            self.consume()
+            self.index += 1
             pairs: List[tuple[Expression, Expression]] = []
             if self.current.type != "RBRACE":
                 while True:
@@ -422,6 +432,22 @@ class Parser:
             return DictLiteral(pairs)
         raise SyntaxError(f"Unexpected token {tok.type} at line {tok.line}")
 
+    # Statement keywords dispatch through a single dict probe on the token
+    # type; anything else is parsed as an expression statement.
+    _statement_handlers = {
+        "IMPORT": parse_import_statement,
+        "EXPORT": parse_export_statement,
+        "LET": parse_declaration_statement,
+        "CONST": parse_declaration_statement,
+        "FN": parse_function_statement,
+        "FUNCTION": parse_function_statement,
+        "RETURN": parse_return_statement,
+        "IF": parse_if_statement,
+        "WHILE": parse_while_statement,
+        "FOR": parse_for_statement,
+        "SPAWN": parse_spawn_statement,
+    }
+
 
 def parse(tokens: Sequence[Token]) -> Module:
     parser = Parser(tokens)
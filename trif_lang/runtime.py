@@ -1,18 +1,25 @@
 """Runtime utilities for executing compiled Trif code."""
 from __future__ import annotations
 
+import functools
 import importlib
+import importlib.util
+import marshal
+import os
+import queue
+import struct
 import sys
 import threading
+import traceback
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from types import CodeType, MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
 
 
 class ModuleProxy:
     """Lightweight proxy exposing Trif module exports."""
 
-    def __init__(self, module: ModuleType, exports: Dict[str, Any] | None, default: Any | None) -> None:
+    def __init__(self, module: ModuleType, exports: Mapping[str, Any] | None, default: Any | None) -> None:
         self._module = module
         self._exports = exports or {}
         self._default = default
@@ -39,6 +46,109 @@ class ModuleProxy:
         return self._module
 
 
+def _public_exports(module: ModuleType) -> Dict[str, Any]:
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in dir(module) if not name.startswith("_")]
+    result: Dict[str, Any] = {}
+    for name in names:
+        try:
+            result[name] = getattr(module, name)
+        except AttributeError:
+            continue
+    return result
+
+
+def _static_module_factory(module: ModuleType, default: Any | None = None) -> Callable[[], ModuleProxy]:
+    exports = MappingProxyType(_public_exports(module))
+    return lambda: ModuleProxy(module, exports, default)
+
+
+@functools.cache
+def _stdlib_registry() -> Mapping[str, Callable[[], ModuleProxy]]:
+    """Import the ``std`` modules and build their proxies once per process."""
+
+    from .std import (
+        data,
+        fs,
+        http,
+        io,
+        managers,
+        memory,
+        mobile,
+        net,
+        process,
+        crypto,
+        reverse,
+        threading as trif_threading,
+        web,
+    )
+
+    modules = {
+        "std.io": io,
+        "std.net": net,
+        "std.data": data,
+        "std.threading": trif_threading,
+        "std.http": http,
+        "std.mobile": mobile,
+        "std.memory": memory,
+        "std.reverse": reverse,
+        "std.managers": managers,
+        "std.fs": fs,
+        "std.process": process,
+        "std.crypto": crypto,
+        "std.web": web,
+    }
+    return MappingProxyType({alias: _static_module_factory(module) for alias, module in modules.items()})
+
+
+class _SpawnPool:
+    """Run ``spawn`` callables on reusable daemon worker threads.
+
+    A new worker is started only when no idle one is available, so every task
+    still begins immediately (long-running tasks never starve the pool), but
+    bursts of short tasks reuse threads instead of creating one per call.
+    Workers that stay idle for *keep_alive* seconds exit.
+    """
+
+    def __init__(self, keep_alive: float = 60.0) -> None:
+        self._tasks: "queue.SimpleQueue[Callable[[], Any]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._keep_alive = keep_alive
+
+    def submit(self, callable_obj: Callable[[], Any]) -> None:
+        with self._lock:
+            start_worker = self._idle == 0
+            if not start_worker:
+                self._idle -= 1
+        self._tasks.put(callable_obj)
+        if start_worker:
+            threading.Thread(target=self._work, name="trif-spawn", daemon=True).start()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                task = self._tasks.get(timeout=self._keep_alive)
+            except queue.Empty:
+                with self._lock:
+                    # A zero count means a submitter has already claimed this
+                    # worker and its task is on the way.
+                    if self._idle:
+                        self._idle -= 1
+                        return
+                continue
+            try:
+                task()
+            except Exception:
+                traceback.print_exc()
+            with self._lock:
+                self._idle += 1
+
+
+_spawn_pool = _SpawnPool()
+
+
 class Runtime:
     def __init__(self) -> None:
         self.registry: Dict[str, Callable[[], ModuleProxy]] = {}
@@ -47,41 +157,17 @@ class Runtime:
         self.project_roots: Set[Path] = set()
         self.search_roots: Set[Path] = set()
         self.search_roots.add(Path.cwd())
+        self._last_cwd: str | None = None
         self.register_stdlib()
 
     def register_stdlib(self) -> None:
-        from .std import (
-            data,
-            fs,
-            http,
-            io,
-            managers,
-            memory,
-            mobile,
-            net,
-            process,
-            crypto,
-            reverse,
-            threading as trif_threading,
-            web,
-        )
-
-        self._register_static_module("std.io", io)
-        self._register_static_module("std.net", net)
-        self._register_static_module("std.data", data)
-        self._register_static_module("std.threading", trif_threading)
-        self._register_static_module("std.http", http)
-        self._register_static_module("std.mobile", mobile)
-        self._register_static_module("std.memory", memory)
-        self._register_static_module("std.reverse", reverse)
-        self._register_static_module("std.managers", managers)
-        self._register_static_module("std.fs", fs)
-        self._register_static_module("std.process", process)
-        self._register_static_module("std.crypto", crypto)
-        self._register_static_module("std.web", web)
+        self.registry.update(_stdlib_registry())
 
     def import_module(self, name: str) -> ModuleProxy:
-        self.prepare_project_environment(Path.cwd())
+        cwd = os.getcwd()
+        if cwd != self._last_cwd:
+            self.prepare_project_environment(Path(cwd))
+            self._last_cwd = cwd
         if name in self.registry:
             return self.registry[name]()
         try:
@@ -113,9 +199,7 @@ class Runtime:
         return value
 
     def spawn(self, callable_obj: Callable[[], Any]) -> None:
-        thread = threading.Thread(target=callable_obj)
-        thread.daemon = True
-        thread.start()
+        _spawn_pool.submit(callable_obj)
 
     def default_entry_point(self, env: Dict[str, Any]) -> None:
         main = env.get("main")
@@ -152,22 +236,10 @@ class Runtime:
         *,
         default: Any | None = None,
     ) -> None:
-        exports = self._module_public_exports(module)
-        self.registry[alias] = lambda module=module, exports=exports, default=default: ModuleProxy(
-            module, exports, default
-        )
+        self.registry[alias] = _static_module_factory(module, default)
 
     def _module_public_exports(self, module: ModuleType) -> Dict[str, Any]:
-        names = getattr(module, "__all__", None)
-        if names is None:
-            names = [name for name in dir(module) if not name.startswith("_")]
-        result: Dict[str, Any] = {}
-        for name in names:
-            try:
-                result[name] = getattr(module, name)
-            except AttributeError:
-                continue
-        return result
+        return _public_exports(module)
 
     def _wrap_module(self, module: ModuleType) -> ModuleProxy:
         module_name = module.__name__
@@ -182,10 +254,7 @@ class Runtime:
         for base in list(self.search_roots):
             candidate = (base / module_path).with_suffix(".trif")
             if candidate.exists():
-                from .compiler import Compiler
-
-                compiler = Compiler()
-                code = compiler.compile_file(candidate, target="python")
+                code = self._load_trif_code(candidate)
                 module = ModuleType(name)
                 package = name.rpartition(".")[0] or None
                 module_dict = module.__dict__
@@ -195,6 +264,39 @@ class Runtime:
                 return module
         return None
 
+    def _load_trif_code(self, source: Path) -> CodeType:
+        """Return the code object for *source*, reusing a cached compile when fresh.
+
+        Compiled code is marshalled to ``__pycache__`` next to the source with a
+        header recording the interpreter magic, a digest of the compiler sources
+        (so codegen and optimizer changes invalidate it), and the source
+        ``st_mtime_ns``/``st_size``; any mismatch triggers a recompile.
+        """
+
+        from .compiler import CODEGEN_CACHE_VERSION, Compiler
+
+        stat = source.stat()
+        header = importlib.util.MAGIC_NUMBER + CODEGEN_CACHE_VERSION + struct.pack(
+            "<QQ", stat.st_mtime_ns, stat.st_size
+        )
+        cache_path = source.parent / "__pycache__" / f"{source.stem}.trif.{sys.implementation.cache_tag}.pyc"
+        try:
+            data = cache_path.read_bytes()
+            if data.startswith(header):
+                return marshal.loads(data[len(header):])
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        code = Compiler().compile_file(source, target="python")
+        code_obj = compile(code, str(source), "exec")
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(header + marshal.dumps(code_obj))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return code_obj
+
 
 runtime = Runtime()
 
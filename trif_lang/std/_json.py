@@ -0,0 +1,60 @@
+"""orjson fast path shared by the std modules that produce JSON.
+
+``orjson`` is optional. :func:`dumps` returns ``None`` whenever the caller
+should use :mod:`json` instead, so the encoded value does not depend on
+whether the package is installed. Formatting can differ: orjson writes
+non-ASCII text unescaped and floats such as ``1e300`` without the ``+``.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+try:  # orjson is optional; callers fall back to the json module.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None  # type: ignore[assignment]
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(key) or _has_non_finite(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _unsupported(value: Any) -> Any:
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, *, indent: bool = False) -> bytes | None:
+    """Encode *data* with orjson, or return ``None`` when json must be used.
+
+    That is the case when orjson is missing, rejects a value, or *data*
+    holds NaN or an infinity: orjson writes those as ``null`` where json
+    writes ``NaN`` and ``Infinity``. Dataclasses, datetimes, and non-string
+    keys are rejected so they reach json and fail or encode the same way.
+    ``uuid.UUID`` and plain ``Enum`` members are the exception: orjson always
+    encodes them, where json raises ``TypeError``.
+    """
+
+    if _orjson is None:
+        return None
+    option = _orjson.OPT_PASSTHROUGH_DATACLASS | _orjson.OPT_PASSTHROUGH_DATETIME
+    if indent:
+        option |= _orjson.OPT_INDENT_2
+    try:
+        encoded = _orjson.dumps(data, default=_unsupported, option=option)
+    except TypeError:
+        return None
+    # Non-finite floats can only have become "null", so most payloads skip
+    # the walk entirely.
+    if b"null" in encoded and _has_non_finite(data):
+        return None
+    return encoded
+
+
+__all__ = ["dumps"]
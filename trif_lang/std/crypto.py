@@ -3,14 +3,19 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import os
 import secrets
 import uuid
 from typing import Iterable
 
 
-def _ensure_bytes(data: str | bytes | bytearray | memoryview | Iterable[int]) -> bytes:
-    if isinstance(data, (bytes, bytearray, memoryview)):
-        return bytes(data)
+def _ensure_bytes(data: str | bytes | bytearray | memoryview | Iterable[int]) -> bytes | bytearray | memoryview:
+    # hashlib consumes the buffer protocol directly, so bytes-like inputs are
+    # passed through without copying; only strided views need flattening.
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    if isinstance(data, memoryview):
+        return data if data.c_contiguous else data.tobytes()
     if isinstance(data, str):
         return data.encode("utf-8")
     return bytes(data)
@@ -34,10 +39,26 @@ def md5(data: str | bytes | bytearray | memoryview | Iterable[int]) -> str:
     return hashlib.md5(_ensure_bytes(data)).hexdigest()
 
 
+def sha256File(path: str | os.PathLike[str]) -> str:
+    """Return the hexadecimal SHA-256 digest of the file at *path*.
+
+    The file is streamed into the hash rather than loaded into memory.
+    """
+
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(1 << 18), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
 def hmacSha256(key: str | bytes, data: str | bytes) -> str:
     """Return an HMAC-SHA256 signature for *data* using *key*."""
 
-    return hmac.new(_ensure_bytes(key), _ensure_bytes(data), hashlib.sha256).hexdigest()
+    # hmac insists on bytes/bytearray keys; keys are small so copying is cheap.
+    return hmac.new(bytes(_ensure_bytes(key)), _ensure_bytes(data), hashlib.sha256).hexdigest()
 
 
 def randomBytes(length: int) -> bytes:
@@ -62,6 +83,7 @@ __all__ = [
     "sha256",
     "sha1",
     "md5",
+    "sha256File",
     "hmacSha256",
     "randomBytes",
     "randomHex",
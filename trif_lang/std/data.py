@@ -3,19 +3,73 @@ from __future__ import annotations
 
 import csv
 import json
-from collections import defaultdict
+import math
+from collections import defaultdict, deque
 from pathlib import Path
-from statistics import mean
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, TypeVar
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, TypeVar
+
+try:  # NumPy is optional; summaries fall back to pure Python without it.
+    import numpy as _np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None  # type: ignore[assignment]
+
+from . import _json
 
 T = TypeVar("T")
 K = TypeVar("K")
 
 
-def load_csv(path: str) -> List[dict[str, str]]:
+def _csv_records(fh: Any) -> Tuple[List[str], Iterator[List[str]]]:
+    reader = csv.reader(fh)
+    header = next(reader, [])
+    return header, (row for row in reader if row)
+
+
+def _ragged_record(header: List[str], row: List[str]) -> dict[Any, Any]:
+    # Mirror csv.DictReader: missing cells become None and surplus cells are
+    # collected in a list under the None key.
+    record: dict[Any, Any] = dict(zip(header, row))
+    if len(row) < len(header):
+        for column in header[len(row):]:
+            record[column] = None
+    else:
+        record[None] = row[len(header):]
+    return record
+
+
+def load_csv_columnar(path: str) -> Tuple[List[str], List[List[str]]]:
+    """Return the header and the raw cell lists of the CSV file at *path*.
+
+    Rows are plain lists indexed by column position, avoiding a dictionary per
+    row; pass the result to :func:`summarize_columns` or index it directly.
+    """
+
     with Path(path).open(newline="", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        return list(reader)
+        header, records = _csv_records(fh)
+        return header, list(records)
+
+
+def iter_csv(path: str) -> Iterator[dict[str, str]]:
+    """Yield the rows of the CSV file at *path* one at a time.
+
+    Only the current row is held in memory, so the result can be piped into
+    :func:`filter_rows`, :func:`map_rows`, or :func:`summarize_numeric` for
+    files larger than RAM. :func:`group_rows` and the sorting/joining helpers
+    still materialise their input.
+    """
+
+    with Path(path).open(newline="", encoding="utf-8") as fh:
+        header, records = _csv_records(fh)
+        width = len(header)
+        for row in records:
+            if len(row) == width:
+                yield dict(zip(header, row))
+            else:
+                yield _ragged_record(header, row)
+
+
+def load_csv(path: str) -> List[dict[str, str]]:
+    return list(iter_csv(path))
 
 
 def save_csv(path: str, rows: Iterable[dict[str, Any]]) -> None:
@@ -38,6 +92,9 @@ def map_rows(rows: Iterable[dict[str, Any]], mapper: Callable[[dict[str, Any]],
 
 
 def to_json(data: Any) -> str:
+    encoded = _json.dumps(data, indent=True)
+    if encoded is not None:
+        return encoded.decode("utf-8")
     return json.dumps(data, indent=2)
 
 
@@ -71,9 +128,11 @@ def select_columns(rows: Iterable[Mapping[str, Any]], columns: Sequence[str]) ->
     return [{column: row.get(column) for column in column_set} for row in rows]
 
 
-def summarize_numeric(rows: Iterable[Mapping[str, Any]], columns: Sequence[str]) -> Dict[str, Dict[str, float]]:
-    """Compute summary statistics for numeric *columns* within *rows*."""
+def _empty_summary() -> Dict[str, float]:
+    return {"count": 0.0, "min": float("nan"), "max": float("nan"), "mean": float("nan")}
 
+
+def _summarize_numeric_numpy(rows: Iterable[Mapping[str, Any]], columns: Sequence[str]) -> Dict[str, Dict[str, float]]:
     extracted: Dict[str, List[float]] = {column: [] for column in columns}
     for row in rows:
         for column in columns:
@@ -83,24 +142,110 @@ def summarize_numeric(rows: Iterable[Mapping[str, Any]], columns: Sequence[str])
     summary: Dict[str, Dict[str, float]] = {}
     for column, values in extracted.items():
         if values:
+            array = _np.fromiter(values, dtype=_np.float64, count=len(values))
             summary[column] = {
-                "count": float(len(values)),
-                "min": min(values),
-                "max": max(values),
-                "mean": mean(values),
+                "count": float(array.size),
+                "min": float(array.min()),
+                "max": float(array.max()),
+                "mean": float(array.mean()),
             }
         else:
-            summary[column] = {"count": 0.0, "min": float("nan"), "max": float("nan"), "mean": float("nan")}
+            summary[column] = _empty_summary()
+    return summary
+
+
+def summarize_numeric(rows: Iterable[Mapping[str, Any]], columns: Sequence[str]) -> Dict[str, Dict[str, float]]:
+    """Compute summary statistics for numeric *columns* within *rows*.
+
+    Without NumPy the count, sum, minimum, and maximum of every column are
+    folded in a single pass so no per-column value list is materialised.
+    """
+
+    if _np is not None:
+        return _summarize_numeric_numpy(rows, columns)
+    # Per column: [count, total, minimum, maximum].
+    stats: Dict[str, List[Any]] = {column: [0, 0.0, math.inf, -math.inf] for column in columns}
+    for row in rows:
+        for column in columns:
+            value = row.get(column)
+            if isinstance(value, (int, float)):
+                value = float(value)
+                entry = stats[column]
+                entry[0] += 1
+                entry[1] += value
+                if value < entry[2]:
+                    entry[2] = value
+                if value > entry[3]:
+                    entry[3] = value
+    return _finish_summary(stats)
+
+
+def summarize_columns(
+    header: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+) -> Dict[str, Dict[str, float]]:
+    """Columnar counterpart of :func:`summarize_numeric`.
+
+    *header* and *rows* take the shape returned by :func:`load_csv_columnar`.
+    Text cells are parsed with ``float``; cells that are not numbers are
+    skipped, as are requested columns missing from *header*.
+    """
+
+    positions = {name: index for index, name in enumerate(header)}
+    targets = [(positions[column], column) for column in columns if column in positions]
+    stats: Dict[str, List[Any]] = {column: [0, 0.0, math.inf, -math.inf] for column in columns}
+    for row in rows:
+        for index, column in targets:
+            if index >= len(row):
+                continue
+            try:
+                value = float(row[index])
+            except (TypeError, ValueError):
+                continue
+            entry = stats[column]
+            entry[0] += 1
+            entry[1] += value
+            if value < entry[2]:
+                entry[2] = value
+            if value > entry[3]:
+                entry[3] = value
+    return _finish_summary(stats)
+
+
+def _finish_summary(stats: Dict[str, List[Any]]) -> Dict[str, Dict[str, float]]:
+    summary: Dict[str, Dict[str, float]] = {}
+    for column, (count, total, minimum, maximum) in stats.items():
+        if count:
+            summary[column] = {"count": float(count), "min": minimum, "max": maximum, "mean": total / count}
+        else:
+            summary[column] = _empty_summary()
     return summary
 
 
-def distinct(rows: Iterable[Mapping[str, Any]], *, key: Callable[[Mapping[str, Any]], T] | None = None) -> List[Mapping[str, Any]]:
-    """Return unique rows preserving order."""
+def distinct(
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    key: Callable[[Mapping[str, Any]], T] | None = None,
+    columns: Sequence[str] | None = None,
+) -> List[Mapping[str, Any]]:
+    """Return unique rows preserving order.
+
+    Without *key* or *columns*, rows are compared by their items in insertion
+    order, which is the header order for rows from :func:`load_csv`. Pass
+    *columns* when rows may list the same fields in different orders.
+    """
 
     seen: set[Any] = set()
     unique_rows: List[Mapping[str, Any]] = []
     for row in rows:
-        value = key(row) if key is not None else tuple(sorted(row.items()))
+        value: Any
+        if key is not None:
+            value = key(row)
+        elif columns is not None:
+            value = tuple([row.get(column) for column in columns])
+        else:
+            value = tuple(row.items())
         if value in seen:
             continue
         seen.add(value)
@@ -123,32 +268,37 @@ def join_rows(
         right_lookup[effective_right_key(row)].append(row)
 
     joined_rows: List[Dict[str, Any]] = []
+    append = joined_rows.append
     for left_row in left:
-        key_value = left_key(left_row)
-        matches = right_lookup.get(key_value, [])
-        for right_row in matches:
-            merged: Dict[str, Any] = {}
-            merged.update(left_row)
-            merged.update(right_row)
-            joined_rows.append(merged)
+        for right_row in right_lookup.get(left_key(left_row), ()):
+            append({**left_row, **right_row})
     return joined_rows
 
 
-def window(rows: Sequence[T], size: int, *, step: int = 1) -> List[Tuple[T, ...]]:
-    """Return sliding windows across *rows*."""
+def window(rows: Iterable[T], size: int, *, step: int = 1) -> List[Tuple[T, ...]]:
+    """Return sliding windows across *rows*.
+
+    *rows* is consumed in one pass through a bounded deque, so any iterable
+    works and each window is copied exactly once.
+    """
 
     if size <= 0:
         raise ValueError("Window size must be positive.")
     if step <= 0:
         raise ValueError("Window step must be positive.")
     result: List[Tuple[T, ...]] = []
-    for index in range(0, max(len(rows) - size + 1, 0), step):
-        result.append(tuple(rows[index : index + size]))
+    buffer: Deque[T] = deque(maxlen=size)
+    for index, row in enumerate(rows, 1):
+        buffer.append(row)
+        if index >= size and (index - size) % step == 0:
+            result.append(tuple(buffer))
     return result
 
 
 __all__ = [
+    "iter_csv",
     "load_csv",
+    "load_csv_columnar",
     "save_csv",
     "filter_rows",
     "map_rows",
@@ -157,6 +307,7 @@ __all__ = [
     "sort_rows",
     "select_columns",
     "summarize_numeric",
+    "summarize_columns",
     "distinct",
     "join_rows",
     "window",
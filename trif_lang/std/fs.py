@@ -1,14 +1,31 @@
 """Filesystem utilities for Trif programs."""
 from __future__ import annotations
 
+import errno
+import mmap as _mmap
 import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, List
+from typing import Iterable, Iterator, List, Tuple
 
+from . import _iouring
 
-@dataclass(frozen=True)
+# Larger than io.DEFAULT_BUFFER_SIZE so line iteration refills less often.
+_LINE_BUFFER_SIZE = 128 * 1024
+_READ_CHUNK_SIZE = 256 * 1024
+# Files at least this large are memory-mapped when readBytes(mmap=True).
+_MMAP_THRESHOLD = 1 << 20
+# errno values meaning the kernel cannot copy between these two files.
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.ENOTSOCK}
+)
+_O_FLAGS = getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_O_RDONLY = os.O_RDONLY | _O_FLAGS
+_O_CREATE = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_FLAGS
+
+
+@dataclass(frozen=True, slots=True)
 class DirectoryEntry:
     """Information about an entry returned from :func:`scan`."""
 
@@ -57,10 +74,45 @@ def writeText(
     file_path.write_text(content, encoding=encoding)
 
 
-def readBytes(path: str | os.PathLike[str]) -> bytes:
-    """Read the complete contents of *path* as raw bytes."""
+def readMmap(path: str | os.PathLike[str]) -> _mmap.mmap:
+    """Map *path* read-only into memory and return the :class:`mmap.mmap`.
+
+    Pages are loaded from the page cache on first access rather than copied
+    up front. Empty files cannot be mapped and raise :class:`ValueError`.
+    """
+
+    fd = os.open(path, _O_RDONLY)
+    try:
+        return _mmap.mmap(fd, 0, access=_mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def readBytes(path: str | os.PathLike[str], *, mmap: bool = False) -> bytes | memoryview:
+    """Read the complete contents of *path* as raw bytes.
 
-    return _ensure_path(path).read_bytes()
+    The file is read with unbuffered :func:`os.read` calls sized from
+    :func:`os.fstat`, so no buffered file object is constructed. With *mmap*
+    set, files of 1 MiB or more are memory-mapped instead and returned as a
+    read-only :class:`memoryview`, avoiding the copy into a ``bytes`` object.
+    """
+
+    fd = os.open(path, _O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if mmap and size >= _MMAP_THRESHOLD:
+            return memoryview(_mmap.mmap(fd, 0, access=_mmap.ACCESS_READ))
+        # Ask for one byte more than the reported size so a regular file is
+        # consumed by a single read; the loop covers files that grow or report
+        # no size (e.g. /proc entries).
+        request = size + 1 if size else _READ_CHUNK_SIZE
+        chunks: List[bytes] = []
+        while chunk := os.read(fd, request):
+            chunks.append(chunk)
+            request = _READ_CHUNK_SIZE
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
 
 
 def writeBytes(path: str | os.PathLike[str], data: bytes | bytearray | memoryview) -> None:
@@ -71,6 +123,38 @@ def writeBytes(path: str | os.PathLike[str], data: bytes | bytearray | memoryvie
     file_path.write_bytes(bytes(data))
 
 
+def readBytesMany(paths: Iterable[str | os.PathLike[str]]) -> List[bytes]:
+    """Read every file in *paths* and return their contents in order.
+
+    On Linux with the optional ``liburing`` bindings installed and
+    ``TRIF_IO_URING=1`` set, the opens, reads, and closes are submitted to
+    io_uring in batches so each batch costs a single submission syscall.
+    Otherwise, and for a single path, this is equivalent to calling
+    :func:`readBytes` for every entry.
+    """
+
+    paths = list(paths)
+    if len(paths) > 1 and _iouring.available():
+        return _iouring.read_many(paths)
+    return [bytes(readBytes(path)) for path in paths]
+
+
+def writeBytesMany(items: Iterable[Tuple[str | os.PathLike[str], bytes | bytearray | memoryview]]) -> None:
+    """Write each ``(path, data)`` pair, creating parents as required.
+
+    Uses the same opt-in io_uring batching as :func:`readBytesMany`.
+    """
+
+    items = list(items)
+    for path, _ in items:
+        _ensure_path(path).parent.mkdir(parents=True, exist_ok=True)
+    if len(items) > 1 and _iouring.available():
+        _iouring.write_many(items)
+        return
+    for path, data in items:
+        writeBytes(path, data)
+
+
 def exists(path: str | os.PathLike[str]) -> bool:
     """Return ``True`` when *path* exists."""
 
@@ -96,11 +180,55 @@ def remove(path: str | os.PathLike[str], *, recursive: bool = False) -> None:
         target.unlink()
 
 
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    # Returns False when neither copy_file_range nor sendfile can be used for
+    # this pair of files, leaving the caller to fall back to shutil.
+    for name in ("copy_file_range", "sendfile"):
+        kernel_copy = getattr(os, name, None)
+        if kernel_copy is None:
+            continue
+        copied = 0
+        try:
+            while copied < size:
+                if name == "sendfile":
+                    sent = kernel_copy(dst_fd, src_fd, None, size - copied)
+                else:
+                    sent = kernel_copy(src_fd, dst_fd, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as exc:
+            if copied or exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            continue
+        return True
+    return False
+
+
+def _fast_copy(src: Path, dest: Path) -> None:
+    if dest.exists() and os.path.samefile(src, dest):
+        raise shutil.SameFileError(f"{src} and {dest} are the same file")
+    src_fd = os.open(src, _O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd = os.open(dest, _O_CREATE, 0o666)
+        try:
+            # Files reporting no size (e.g. /proc entries) go through shutil.
+            copied = size > 0 and _kernel_copy(src_fd, dst_fd, size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    if not copied:
+        shutil.copyfile(src, dest)
+
+
 def copy(src: str | os.PathLike[str], dest: str | os.PathLike[str], *, overwrite: bool = True) -> None:
     """Copy *src* to *dest*.
 
-    Directories are copied recursively while files use :func:`shutil.copy2` to
-    preserve metadata.
+    Directories are copied recursively with :func:`shutil.copytree`. Files are
+    copied inside the kernel where the platform allows it and keep their
+    metadata as with :func:`shutil.copy2`.
     """
 
     src_path = _ensure_path(src)
@@ -115,7 +243,10 @@ def copy(src: str | os.PathLike[str], dest: str | os.PathLike[str], *, overwrite
         shutil.copytree(src_path, dest_path)
     else:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dest_path)
+        if dest_path.is_dir():
+            dest_path = dest_path / src_path.name
+        _fast_copy(src_path, dest_path)
+        shutil.copystat(src_path, dest_path)
 
 
 def move(src: str | os.PathLike[str], dest: str | os.PathLike[str], *, overwrite: bool = True) -> None:
@@ -146,34 +277,81 @@ def stat(path: str | os.PathLike[str]) -> os.stat_result:
     return _ensure_path(path).stat()
 
 
+def _scandir_recursive(path: str, recursive: bool) -> Iterator[os.DirEntry[str]]:
+    # DirEntry caches the file type reported by the directory listing, so
+    # classifying an entry costs no extra syscall. Only files and directories
+    # are yielded; each directory is yielded before its contents.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+            elif entry.is_dir():
+                yield entry
+                # Like Path.rglob, do not descend through symlinked directories.
+                if recursive and not entry.is_symlink():
+                    yield from _scandir_recursive(entry.path, recursive)
+
+
 def scan(
     path: str | os.PathLike[str],
     *,
     recursive: bool = False,
     include_files: bool = True,
     include_dirs: bool = True,
+    only_extension: str | None = None,
 ) -> Iterator[DirectoryEntry]:
-    """Iterate entries from *path* yielding :class:`DirectoryEntry` objects."""
-
-    base = _ensure_path(path)
-    if recursive:
-        for entry in base.rglob("*"):
-            if entry.is_file() and include_files:
-                yield DirectoryEntry(str(entry), True, False, entry.stat().st_size)
-            elif entry.is_dir() and include_dirs:
-                yield DirectoryEntry(str(entry), False, True, 0)
-    else:
-        for entry in base.iterdir():
-            if entry.is_file() and include_files:
-                yield DirectoryEntry(str(entry), True, False, entry.stat().st_size)
-            elif entry.is_dir() and include_dirs:
-                yield DirectoryEntry(str(entry), False, True, 0)
+    """Iterate entries from *path* yielding :class:`DirectoryEntry` objects.
+
+    The result is a lazy generator: entries are produced while the directory
+    tree is walked and nothing is collected up front, so memory stays bounded
+    by the tree depth unless the caller materialises it. When
+    *only_extension* is given (e.g. ``".py"``), only files whose name ends
+    with it are yielded.
+    """
+
+    for entry in _scandir_recursive(os.fspath(path), recursive):
+        if entry.is_file():
+            if include_files and (only_extension is None or entry.name.endswith(only_extension)):
+                yield DirectoryEntry(entry.path, True, False, entry.stat().st_size)
+        elif include_dirs and only_extension is None:
+            yield DirectoryEntry(entry.path, False, True, 0)
+
+
+def scan_paths(
+    path: str | os.PathLike[str],
+    *,
+    recursive: bool = True,
+    only_extension: str | None = None,
+) -> Iterator[str]:
+    """Lazily yield the paths of the files and directories below *path*.
+
+    A lighter :func:`scan` for callers that only need paths: entries are not
+    stat'ed and no :class:`DirectoryEntry` objects are built. *only_extension*
+    restricts the output to matching files as in :func:`scan`.
+    """
+
+    for entry in _scandir_recursive(os.fspath(path), recursive):
+        if only_extension is None or (entry.name.endswith(only_extension) and entry.is_file()):
+            yield entry.path
 
 
 def readLines(path: str | os.PathLike[str], *, encoding: str = "utf-8") -> List[str]:
     """Return the contents of *path* split into lines."""
 
-    return _ensure_path(path).read_text(encoding=encoding).splitlines()
+    with open(path, "r", encoding=encoding, buffering=_LINE_BUFFER_SIZE) as fh:
+        return [line.rstrip("\n") for line in fh]
+
+
+def iterLines(path: str | os.PathLike[str], *, encoding: str = "utf-8") -> Iterator[str]:
+    """Yield the lines of *path* one at a time without their line endings.
+
+    Unlike :func:`readLines` only the current line is held in memory, which
+    suits large logs that are filtered or counted as they are read.
+    """
+
+    with open(path, "r", encoding=encoding, buffering=_LINE_BUFFER_SIZE) as fh:
+        for line in fh:
+            yield line.rstrip("\n")
 
 
 def touch(path: str | os.PathLike[str], *, exist_ok: bool = True) -> None:
@@ -203,7 +381,10 @@ __all__ = [
     "readText",
     "writeText",
     "readBytes",
+    "readMmap",
     "writeBytes",
+    "readBytesMany",
+    "writeBytesMany",
     "exists",
     "makeDirs",
     "remove",
@@ -213,7 +394,9 @@ __all__ = [
     "resolve",
     "stat",
     "scan",
+    "scan_paths",
     "readLines",
+    "iterLines",
     "touch",
     "currentDir",
     "changeDir",
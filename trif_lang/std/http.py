@@ -1,16 +1,60 @@
 """Express-style HTTP helpers."""
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import json
 import threading
 import time
+import traceback
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable, Dict, List, Optional
 
+from . import _json
 
-@dataclass
+_NO_ROUTES: Dict[str, Callable[..., Any]] = {}
+_TEXT_TYPE = "text/plain; charset=utf-8"
+_HTML_TYPE = "text/html; charset=utf-8"
+_JSON_TYPE = "application/json; charset=utf-8"
+_KEEP_ALIVE = b"Connection: keep-alive\r\n\r\n"
+_CLOSE = b"Connection: close\r\n\r\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _header_line(key: str, value: str) -> bytes:
+    return f"{key}: {value}\r\n".encode("latin-1")
+
+
+@functools.lru_cache(maxsize=64)
+def _status_line(status: int) -> bytes:
+    # Handlers may return codes HTTPStatus does not know; send those with an
+    # empty reason phrase instead of failing the response.
+    try:
+        phrase = HTTPStatus(status).phrase
+    except ValueError:
+        phrase = ""
+    return f"HTTP/1.1 {int(status)} {phrase}\r\n".encode("latin-1")
+
+
+def _json_body(payload: Any) -> bytes:
+    encoded = _json.dumps(payload)
+    if encoded is not None:
+        return encoded
+    return json.dumps(payload).encode("utf-8")
+
+
+def _header_block(headers: Dict[str, str] | None) -> bytes:
+    # Serialised header lines are cached, so the common Content-Type headers
+    # are encoded once per process rather than once per response.
+    if not headers:
+        return b""
+    return b"".join([_header_line(key, value) for key, value in headers.items()])
+
+
+@dataclass(slots=True)
 class HttpResponse:
     body: bytes
     status: int = HTTPStatus.OK
@@ -18,21 +62,23 @@ class HttpResponse:
 
 
 class HttpContext:
-    def __init__(self, handler: BaseHTTPRequestHandler) -> None:
+    __slots__ = ("_handler", "headers")
+
+    def __init__(self, handler: BaseHTTPRequestHandler | None) -> None:
         self._handler = handler
         self.headers: Dict[str, str] = {}
 
     def text(self, text: str, *, status: int = HTTPStatus.OK) -> HttpResponse:
-        return HttpResponse(text.encode("utf-8"), status, {"Content-Type": "text/plain; charset=utf-8"})
+        return HttpResponse(text.encode("utf-8"), status, {"Content-Type": _TEXT_TYPE})
 
     def html(self, html: str, *, status: int = HTTPStatus.OK) -> HttpResponse:
-        return HttpResponse(html.encode("utf-8"), status, {"Content-Type": "text/html; charset=utf-8"})
+        return HttpResponse(html.encode("utf-8"), status, {"Content-Type": _HTML_TYPE})
 
     def json(self, payload: Any, *, status: int = HTTPStatus.OK) -> HttpResponse:
         return HttpResponse(
-            json.dumps(payload).encode("utf-8"),
+            _json_body(payload),
             status,
-            {"Content-Type": "application/json; charset=utf-8"},
+            {"Content-Type": _JSON_TYPE},
         )
 
     def send(self, body: str | bytes, *, status: int = HTTPStatus.OK, content_type: str = "text/plain") -> HttpResponse:
@@ -45,12 +91,16 @@ class HttpServer:
         self.host = host
         self.port = port
         self.routes: List[tuple[str, str, Callable[[HttpContext], Any]]] = []
+        # method -> path -> handler; the first registration of a route wins.
+        self._route_map: Dict[str, Dict[str, Callable[[HttpContext], Any]]] = {}
         self._server: ThreadingHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self.router = self
 
     def add_route(self, method: str, path: str, handler: Callable[[HttpContext], Any]) -> None:
-        self.routes.append((method.upper(), path, handler))
+        method = method.upper()
+        self.routes.append((method, path, handler))
+        self._route_map.setdefault(method, {}).setdefault(path, handler)
 
     def get(self, path: str, handler: Callable[[HttpContext], Any]) -> None:
         self.add_route("GET", path, handler)
@@ -69,22 +119,33 @@ class HttpServer:
             return
 
         server = self
+        # Rebuild in case self.routes was edited directly after registration.
+        route_map: Dict[str, Dict[str, Callable[[HttpContext], Any]]] = {}
+        for method, path, handler in self.routes:
+            route_map.setdefault(method, {}).setdefault(path, handler)
+        self._route_map = route_map
 
         class Handler(BaseHTTPRequestHandler):
             def _dispatch(self, method: str) -> None:
-                for registered_method, registered_path, callback in server.routes:
-                    if registered_method == method and registered_path == self.path:
-                        ctx = HttpContext(self)
-                        result = callback(ctx)
-                        response = server._coerce_response(result)
-                        self.send_response(response.status)
-                        headers = response.headers or {}
-                        for key, value in headers.items():
-                            self.send_header(key, value)
-                        self.end_headers()
-                        self.wfile.write(response.body)
-                        return
-                self.send_error(HTTPStatus.NOT_FOUND)
+                callback = server._route_map.get(method, _NO_ROUTES).get(self.path)
+                if callback is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                result = callback(HttpContext(self))
+                response = server._coerce_response(result)
+                self.send_response(response.status)
+                if self.request_version == "HTTP/0.9":
+                    # HTTP/0.9 responses carry no status line or headers, and
+                    # send_response never creates the header buffer for them.
+                    self.wfile.write(response.body)
+                    return
+                # send_response buffers the status, Server, and Date lines;
+                # the handler's headers and the body join that buffer so the
+                # whole response goes out in a single write.
+                self._headers_buffer.append(  # type: ignore[attr-defined]
+                    _header_block(response.headers) + b"\r\n" + response.body
+                )
+                self.flush_headers()
 
             def do_GET(self) -> None:  # noqa: N802 - mandated by BaseHTTPRequestHandler
                 self._dispatch("GET")
@@ -123,7 +184,144 @@ class HttpServer:
             return HttpResponse(result.encode("utf-8"))
         if result is None:
             return HttpResponse(b"")
-        return HttpResponse(json.dumps(result).encode("utf-8"), headers={"Content-Type": "application/json"})
+        return HttpResponse(_json_body(result), headers={"Content-Type": "application/json"})
+
+
+class AsyncHttpServer(HttpServer):
+    """:class:`HttpServer` variant serving every connection from one asyncio loop.
+
+    The event loop runs on a background thread. Plain handlers are called on
+    the loop's default executor so they may block; ``async def`` handlers are
+    awaited on the loop itself. Connections are kept alive for HTTP/1.1.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 5000) -> None:
+        super().__init__(host, port)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_server: asyncio.Server | None = None
+        self._connections: Dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    def listen(self) -> None:
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            self._async_server = asyncio.run_coroutine_threadsafe(
+                asyncio.start_server(self._serve_connection, self.host, self.port), loop
+            ).result()
+        except BaseException:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=1)
+            loop.close()
+            raise
+        self._loop = loop
+        self._thread = thread
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if not loop.is_running():
+            loop.close()
+        self._loop = None
+
+    async def _shutdown(self) -> None:
+        if self._async_server is not None:
+            self._async_server.close()
+            self._async_server = None
+        # Closing the transports ends each connection loop at its next read.
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.wait(list(self._connections), timeout=1)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self._write_response(writer, self._error_response(HTTPStatus.BAD_REQUEST), False)
+                    break
+                method, path, version = parts
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                # HttpContext does not expose request bodies; drain them so the
+                # next request on this connection starts at its request line.
+                # Bodies whose end cannot be found get an error and the
+                # connection is closed, since the stream position is lost.
+                if "transfer-encoding" in headers:
+                    await self._write_response(writer, self._error_response(HTTPStatus.NOT_IMPLEMENTED), False)
+                    break
+                length_text = headers.get("content-length") or "0"
+                if not (length_text.isascii() and length_text.isdigit()):
+                    await self._write_response(writer, self._error_response(HTTPStatus.BAD_REQUEST), False)
+                    break
+                length = int(length_text)
+                if length:
+                    await reader.readexactly(length)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, await self._handle(method, path), keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _handle(self, method: str, path: str) -> HttpResponse:
+        callback = self._route_map.get(method, _NO_ROUTES).get(path)
+        if callback is None:
+            return self._error_response(HTTPStatus.NOT_FOUND)
+        ctx = HttpContext(None)
+        try:
+            if inspect.iscoroutinefunction(callback):
+                result = await callback(ctx)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(None, callback, ctx)
+                if inspect.isawaitable(result):
+                    result = await result
+        except Exception:
+            traceback.print_exc()
+            return self._error_response(HTTPStatus.INTERNAL_SERVER_ERROR)
+        return self._coerce_response(result)
+
+    @staticmethod
+    def _error_response(status: HTTPStatus) -> HttpResponse:
+        return HttpResponse(status.phrase.encode("utf-8"), status, {"Content-Type": _TEXT_TYPE})
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, response: HttpResponse, keep_alive: bool) -> None:
+        writer.write(
+            b"".join(
+                [
+                    _status_line(response.status),
+                    _header_block(response.headers),
+                    b"Content-Length: %d\r\n" % len(response.body),
+                    _KEEP_ALIVE if keep_alive else _CLOSE,
+                    response.body,
+                ]
+            )
+        )
+        await writer.drain()
 
 
 def createServer(config: Optional[Dict[str, Any]] = None) -> HttpServer:
@@ -133,8 +331,15 @@ def createServer(config: Optional[Dict[str, Any]] = None) -> HttpServer:
     return HttpServer(host=host, port=port)
 
 
+def createAsyncServer(config: Optional[Dict[str, Any]] = None) -> AsyncHttpServer:
+    config = config or {}
+    host = config.get("host", "0.0.0.0")
+    port = int(config.get("port", 5000))
+    return AsyncHttpServer(host=host, port=port)
+
+
 def now() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
 
 
-__all__ = ["HttpServer", "HttpContext", "createServer", "now", "HttpResponse"]
+__all__ = ["HttpServer", "AsyncHttpServer", "HttpContext", "createServer", "createAsyncServer", "now", "HttpResponse"]
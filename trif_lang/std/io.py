@@ -2,9 +2,15 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
+from . import _json
+from .fs import readBytes
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
 
 def _ensure_sequence(value: Any) -> Sequence[Any]:
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
@@ -29,6 +35,10 @@ def read_json(path: str) -> Any:
 
 
 def write_json(path: str, data: Any) -> None:
+    encoded = _json.dumps(data, indent=True)
+    if encoded is not None:
+        Path(path).write_bytes(encoded)
+        return
     write_text(path, json.dumps(data, indent=2))
 
 
@@ -36,10 +46,14 @@ def prompt(message: str) -> str:
     return input(message)
 
 
-def read_binary(path: str) -> bytes:
-    """Return the raw bytes stored at *path*."""
+def read_binary(path: str, *, mmap: bool = False) -> bytes | memoryview:
+    """Return the raw bytes stored at *path*.
+
+    With *mmap* set, large files come back as a memory-mapped
+    :class:`memoryview`; see :func:`trif_lang.std.fs.readBytes`.
+    """
 
-    return Path(path).read_bytes()
+    return readBytes(path, mmap=mmap)
 
 
 def write_binary(path: str, data: bytes | bytearray | memoryview) -> None:
@@ -55,10 +69,18 @@ def append_text(path: str, data: str, *, newline: bool = True) -> None:
 
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("a", encoding="utf-8") as fh:
-        fh.write(data)
-        if newline:
-            fh.write("\n")
+    text = data + "\n" if newline else data
+    if os.linesep != "\n":
+        # Match the newline translation a text-mode file would apply.
+        text = text.replace("\n", os.linesep)
+    payload = memoryview(text.encode("utf-8"))
+    # A single O_APPEND write skips the buffered text-file layers entirely.
+    fd = os.open(file_path, _APPEND_FLAGS, 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
 
 
 def print_table(
@@ -104,23 +126,19 @@ def print_table(
             for row in row_sequences
         ]
 
-    widths = [len(str(header)) for header in column_headers]
-    if not widths:
+    header_cells = [str(header) for header in column_headers]
+    if not header_cells:
         println("(no columns)")
         return
-    for row in display_rows:
-        for idx, cell in enumerate(row):
-            if idx >= len(widths):
-                widths.append(len(cell))
-            else:
-                widths[idx] = max(widths[idx], len(cell))
-
-    header_line = " | ".join(str(header).ljust(widths[idx]) for idx, header in enumerate(column_headers))
-    separator = "-+-".join("-" * width for width in widths)
-    println(header_line)
-    println(separator)
-    for row in display_rows:
-        println(" | ".join(cell.ljust(widths[idx]) for idx, cell in enumerate(row)))
+    # Every display row has one cell per header, so widths are the column-wise
+    # maxima of the transposed rows.
+    widths = [
+        max(len(header), max(map(len, column), default=0))
+        for header, column in zip(header_cells, zip(*display_rows))
+    ]
+    lines = [" | ".join(map(str.ljust, header_cells, widths)), "-+-".join(["-" * width for width in widths])]
+    lines.extend([" | ".join(map(str.ljust, row, widths)) for row in display_rows])
+    println("\n".join(lines))
 
 
 def print_lines(lines: Iterable[Any]) -> None:
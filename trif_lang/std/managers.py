@@ -5,6 +5,9 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any, Callable, Deque, Dict, List, Optional
 
+# Marks keys that were absent before an update so it can be undone.
+_MISSING = object()
+
 
 class TaskManager:
     def __init__(self) -> None:
@@ -21,24 +24,81 @@ class TaskManager:
         return results
 
 
-@dataclass
+@dataclass(init=False)
 class StateManager:
-    state: Dict[str, Any] = field(default_factory=dict)
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    state: Dict[str, Any]
+    # One entry per update holding the previous value of every changed key
+    # (or _MISSING), so history costs O(changes) rather than O(state).
+    _reverse_log: List[Dict[str, Any]] = field(repr=False)
+
+    def __init__(
+        self,
+        state: Optional[Dict[str, Any]] = None,
+        history: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self.state = state if state is not None else {}
+        self._reverse_log = []
+        if history:
+            self.history = history
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Snapshots of the state after each update, rebuilt from the undo log.
+
+        The list is a copy; assign a new list of snapshots to replace the
+        history. Its last entry stands for the current state.
+        """
+
+        snapshots: List[Dict[str, Any]] = []
+        current = dict(self.state)
+        for inverse in reversed(self._reverse_log):
+            snapshots.append(current)
+            current = dict(current)
+            _apply_inverse(current, inverse)
+        snapshots.reverse()
+        return snapshots
+
+    @history.setter
+    def history(self, snapshots: List[Dict[str, Any]]) -> None:
+        # Each entry turns a snapshot back into the one before it; the first
+        # snapshot undoes to an empty state. The newest snapshot is always the
+        # current state, since the log is applied to it.
+        log: List[Dict[str, Any]] = []
+        previous: Dict[str, Any] = {}
+        for snapshot in [*snapshots[:-1], self.state] if snapshots else []:
+            keys = [*snapshot, *(key for key in previous if key not in snapshot)]
+            log.append(
+                {
+                    key: previous.get(key, _MISSING)
+                    for key in keys
+                    if previous.get(key, _MISSING) is not snapshot.get(key, _MISSING)
+                }
+            )
+            previous = snapshot
+        self._reverse_log = log
 
     def update(self, **changes: Any) -> Dict[str, Any]:
-        self.state.update(changes)
-        snapshot = dict(self.state)
-        self.history.append(snapshot)
-        return snapshot
+        state = self.state
+        self._reverse_log.append({key: state.get(key, _MISSING) for key in changes})
+        state.update(changes)
+        return dict(state)
 
     def undo(self) -> Dict[str, Any]:
-        if self.history:
-            self.history.pop()
-        self.state = dict(self.history[-1]) if self.history else {}
+        if self._reverse_log:
+            _apply_inverse(self.state, self._reverse_log.pop())
+        if not self._reverse_log:
+            self.state = {}
         return dict(self.state)
 
 
+def _apply_inverse(state: Dict[str, Any], inverse: Dict[str, Any]) -> None:
+    for key, value in inverse.items():
+        if value is _MISSING:
+            del state[key]
+        else:
+            state[key] = value
+
+
 class ResourceManager:
     def __init__(self) -> None:
         self._enter: List[Callable[[], Any]] = []
@@ -72,10 +132,18 @@ class EventManager:
         if handler is None:
             self._handlers.pop(event, None)
             return
-        listeners = self._handlers.get(event, [])
-        self._handlers[event] = [fn for fn in listeners if fn != handler]
-        if not self._handlers[event]:
-            self._handlers.pop(event, None)
+        listeners = self._handlers.get(event)
+        if not listeners:
+            return
+        try:
+            listeners.remove(handler)
+        except ValueError:
+            return
+        if handler in listeners:
+            # Registered more than once: drop every remaining registration.
+            listeners[:] = [fn for fn in listeners if fn != handler]
+        if not listeners:
+            del self._handlers[event]
 
     def emit(self, event: str, payload: Any | None = None) -> List[Any]:
         results: List[Any] = []
@@ -120,7 +188,8 @@ class ResourcePool:
         self._destroy = destroy
         self._max_size = max_size
         self._idle: Deque[Any] = deque()
-        self._in_use: List[Any] = []
+        # Keyed by id() so release is O(1) regardless of pool size.
+        self._in_use: Dict[int, Any] = {}
 
     def acquire(self) -> Any:
         if self._idle:
@@ -129,13 +198,12 @@ class ResourcePool:
             resource = self._create()
         else:
             raise RuntimeError("ResourcePool exhausted")
-        self._in_use.append(resource)
+        self._in_use[id(resource)] = resource
         return resource
 
     def release(self, resource: Any) -> None:
-        if resource not in self._in_use:
+        if self._in_use.pop(id(resource), _MISSING) is _MISSING:
             return
-        self._in_use.remove(resource)
         if len(self._idle) < self._max_size:
             self._idle.append(resource)
         else:
@@ -144,7 +212,7 @@ class ResourcePool:
     def drain(self) -> None:
         while self._idle:
             self._destroy(self._idle.popleft())
-        for resource in list(self._in_use):
+        for resource in list(self._in_use.values()):
             self._destroy(resource)
         self._in_use.clear()
 
@@ -173,26 +241,34 @@ class ConfigurationManager:
 
     def __init__(self, defaults: Optional[Dict[str, Any]] = None) -> None:
         self._layers: List[Dict[str, Any]] = [defaults or {}]
+        # The effective configuration is kept flat so lookups never walk the
+        # layers; each pushed layer records the values it shadowed for pop().
+        self._merged: Dict[str, Any] = dict(self._layers[0])
+        self._shadowed: List[Dict[str, Any]] = []
 
     def push(self, overrides: Dict[str, Any]) -> None:
-        self._layers.append(dict(overrides))
+        layer = dict(overrides)
+        merged = self._merged
+        self._shadowed.append({key: merged.get(key, _MISSING) for key in layer})
+        self._layers.append(layer)
+        merged.update(layer)
 
     def pop(self) -> Dict[str, Any]:
         if len(self._layers) == 1:
             raise RuntimeError("Cannot remove base configuration layer")
+        merged = self._merged
+        for key, value in self._shadowed.pop().items():
+            if value is _MISSING:
+                del merged[key]
+            else:
+                merged[key] = value
         return self._layers.pop()
 
     def get(self, key: str, default: Any | None = None) -> Any:
-        for layer in reversed(self._layers):
-            if key in layer:
-                return layer[key]
-        return default
+        return self._merged.get(key, default)
 
     def merged(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {}
-        for layer in self._layers:
-            result.update(layer)
-        return result
+        return dict(self._merged)
 
 
 __all__ = [
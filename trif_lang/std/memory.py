@@ -1,33 +1,130 @@
 """Memory manipulation helpers for experimentation and tooling."""
 from __future__ import annotations
 
+import ctypes
+import functools
+import re
 import struct
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+try:  # NumPy is optional; read32_many returns a list without it.
+    import numpy as _np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None  # type: ignore[assignment]
+
+try:  # Hyperscan is optional; search_many falls back to one scan per pattern.
+    import hyperscan as _hyperscan  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    _hyperscan = None  # type: ignore[assignment]
+
+_U32 = struct.Struct("<I")
+
+
+@functools.lru_cache(maxsize=16)
+def _literal_pattern(pattern: bytes) -> re.Pattern[bytes]:
+    return re.compile(re.escape(pattern))
+
+
+@functools.lru_cache(maxsize=16)
+def _hyperscan_database(patterns: Tuple[bytes, ...]) -> Any:
+    database = _hyperscan.Database(mode=_hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        # Expressions are NUL-terminated C strings, so every byte is written
+        # as a \xNN escape rather than passed through re.escape.
+        expressions=[b"".join([b"\\x%02x" % byte for byte in pattern]) for pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[_hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns),
+    )
+    return database
 
 
 @dataclass
 class MemoryRegion:
-    _buffer: bytearray
+    """Byte-addressable view over a :class:`bytearray` or any buffer.
+
+    Non-bytearray sources, such as the memoryview from ``fs.readBytes(...,
+    mmap=True)``, are wrapped in place without copying.
+    """
+
+    _buffer: bytearray | memoryview
+
+    def __post_init__(self) -> None:
+        if not isinstance(self._buffer, bytearray):
+            view = memoryview(self._buffer)
+            self._buffer = view if view.format == "B" and view.ndim == 1 else view.cast("B")
 
     def write32(self, offset: int, value: int) -> None:
-        self._buffer[offset : offset + 4] = struct.pack("<I", value & 0xFFFFFFFF)
+        if 0 <= offset <= len(self._buffer) - 4:
+            _U32.pack_into(self._buffer, offset, value & 0xFFFFFFFF)
+        else:
+            # Keep slice semantics at the edges (a bytearray grows when written
+            # past its end).
+            self._buffer[offset : offset + 4] = _U32.pack(value & 0xFFFFFFFF)
 
     def read32(self, offset: int) -> int:
-        return struct.unpack("<I", self._buffer[offset : offset + 4])[0]
+        return _U32.unpack_from(self._buffer, offset)[0]
+
+    def read32_many(self, offsets: Iterable[int]) -> Any:
+        """Read a little-endian ``uint32`` at each of *offsets*.
+
+        Returns a NumPy ``uint32`` array when NumPy is installed, otherwise a
+        list of ints.
+        """
+
+        if _np is not None:
+            starts = _np.fromiter(offsets, dtype=_np.intp)
+            raw = _np.frombuffer(self._buffer, dtype=_np.uint8)
+            return raw[starts[:, None] + _np.arange(4)].view("<u4").ravel()
+        unpack_from = _U32.unpack_from
+        buffer = self._buffer
+        return [unpack_from(buffer, offset)[0] for offset in offsets]
 
     def write_bytes(self, offset: int, data: bytes | Iterable[int]) -> None:
-        block = data if isinstance(data, bytes) else bytes(data)
+        # Slice assignment already copies bytes-like blocks with memcpy.
+        block = data if isinstance(data, (bytes, bytearray, memoryview)) else bytes(data)
         self._buffer[offset : offset + len(block)] = block
 
     def read_bytes(self, offset: int, length: int) -> bytes:
         return bytes(self._buffer[offset : offset + length])
 
     def fill(self, value: int) -> None:
-        self._buffer[:] = bytes([value & 0xFF] * len(self._buffer))
-
-    def search(self, pattern: bytes) -> int:
-        return self._buffer.find(pattern)
+        size = len(self._buffer)
+        if size:
+            ctypes.memset((ctypes.c_char * size).from_buffer(self._buffer), value & 0xFF, size)
+
+    def search(self, pattern: bytes, start: int = 0) -> int:
+        if isinstance(self._buffer, memoryview):
+            # memoryview has no find(); re scans the buffer without copying it.
+            match = _literal_pattern(bytes(pattern)).search(self._buffer, start)
+            return match.start() if match else -1
+        return self._buffer.find(pattern, start)
+
+    def search_many(self, patterns: Iterable[bytes]) -> Dict[bytes, int]:
+        """Return the first offset of each of *patterns* (``-1`` when absent).
+
+        With Hyperscan installed all patterns are matched in a single pass over
+        the buffer; otherwise each pattern is searched for in turn.
+        """
+
+        unique = tuple(dict.fromkeys(bytes(pattern) for pattern in patterns))
+        # Hyperscan rejects patterns that match the empty string.
+        if _hyperscan is None or not unique or b"" in unique:
+            return {pattern: self.search(pattern) for pattern in unique}
+        found: Dict[bytes, int] = {}
+
+        def on_match(index: int, start: int, end: int, flags: int, context: Any) -> bool:
+            # Matches arrive ordered by end offset, which for fixed-length
+            # literals is also their start order.
+            found.setdefault(unique[index], start)
+            return len(found) == len(unique)
+
+        try:
+            _hyperscan_database(unique).scan(self._buffer, match_event_handler=on_match)
+        except _hyperscan.ScanTerminated:
+            pass
+        return {pattern: found.get(pattern, -1) for pattern in unique}
 
     def to_bytes(self) -> bytes:
         return bytes(self._buffer)
@@ -37,8 +134,17 @@ def openBuffer(size: int) -> MemoryRegion:
     return MemoryRegion(bytearray(size))
 
 
+@functools.lru_cache(maxsize=32)
+def _hex_formatter(width: int) -> Callable[[int], str]:
+    return ("0x%0" + str(width) + "X").__mod__
+
+
 def formatHex(value: int, width: int = 8) -> str:
-    return f"0x{value:0{width}X}"
+    return _hex_formatter(width)(value)
+
+
+def formatHexArray(values: Iterable[int], width: int = 8) -> List[str]:
+    return list(map(_hex_formatter(width), values))
 
 
-__all__ = ["MemoryRegion", "openBuffer", "formatHex"]
+__all__ = ["MemoryRegion", "openBuffer", "formatHex", "formatHexArray"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 import socket
 import threading
 from typing import Any, Callable
@@ -20,13 +21,25 @@ def start_tcp_server(host: str, port: int, handler: Callable[[socket.socket, tup
     threading.Thread(target=server, daemon=True).start()
 
 
-def send_tcp_message(host: str, port: int, message: str) -> None:
+def send_tcp_message(host: str, port: int, message: str | bytes | bytearray | memoryview) -> None:
+    data = message.encode("utf-8") if isinstance(message, str) else message
     with socket.create_connection((host, port)) as sock:
-        sock.sendall(message.encode("utf-8"))
+        sock.sendall(data)
+
+
+def send_tcp_file(host: str, port: int, path: str | os.PathLike[str]) -> int:
+    """Stream the file at *path* to ``host:port`` and return the bytes sent.
+
+    Uses :meth:`socket.socket.sendfile`, which hands the copy to the kernel's
+    ``sendfile(2)`` where available instead of reading the file into Python.
+    """
+
+    with open(path, "rb") as fh, socket.create_connection((host, port)) as sock:
+        return sock.sendfile(fh)
 
 
 def broadcast_json(host: str, port: int, payload: Any) -> None:
     send_tcp_message(host, port, json.dumps(payload))
 
 
-__all__ = ["start_tcp_server", "send_tcp_message", "broadcast_json"]
+__all__ = ["start_tcp_server", "send_tcp_message", "send_tcp_file", "broadcast_json"]
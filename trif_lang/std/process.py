@@ -5,9 +5,70 @@ import os
 import shlex
 import shutil
 import subprocess
+import sys
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Iterable, Iterator, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Sequence, Tuple
+
+# CPython launches children with posix_spawn (no page-table copy, no fd walk)
+# when close_fds is off and the executable path contains a directory. Python
+# opens descriptors as non-inheritable (PEP 446), so not closing them in the
+# child is safe for descriptors the program did not mark inheritable itself.
+_FAST_SPAWN = sys.platform.startswith("linux")
+_SEARCH_KEYS = frozenset({"PATH", "PATHEXT"})
+_env_snapshot: Mapping[str, str] | None = None
+_STREAM_CHUNK_SIZE = 64 * 1024
+_WHICH_CACHE_LIMIT = 512
+_which_hits: Dict[Tuple[str, str | None, str | None], str] = {}
+
+
+def _which_cached(executable: str, path: str | None, pathext: str | None) -> str | None:
+    # Only hits are cached, and each is re-checked before it is returned, so
+    # binaries installed or removed later are noticed without a PATH change.
+    # *pathext* only keys the cache: shutil.which reads PATHEXT itself.
+    key = (executable, path, pathext)
+    resolved = _which_hits.get(key)
+    if resolved is not None and os.access(resolved, os.X_OK):
+        return resolved
+    resolved = shutil.which(executable, path=path)
+    if resolved is None:
+        _which_hits.pop(key, None)
+    else:
+        if len(_which_hits) >= _WHICH_CACHE_LIMIT:
+            _which_hits.clear()
+        _which_hits[key] = resolved
+    return resolved
+
+
+def _environment_changed(keys: Iterable[str]) -> None:
+    global _env_snapshot
+    _env_snapshot = None
+    # Resolved executables depend on PATH (and PATHEXT on Windows); drop them
+    # when either changes so newly visible binaries are picked up.
+    if not _SEARCH_KEYS.isdisjoint(keys):
+        _which_hits.clear()
+
+
+def _spawn_options(
+    args: Sequence[str] | str,
+    env: Mapping[str, str] | None,
+    cwd: str | os.PathLike[str] | None,
+    close_fds: bool | None,
+) -> Dict[str, Any]:
+    if close_fds is None:
+        close_fds = not _FAST_SPAWN
+    if close_fds:
+        # subprocess's own default.
+        return {}
+    options: Dict[str, Any] = {"close_fds": False}
+    if _FAST_SPAWN and not isinstance(args, str) and args and cwd is None and not os.path.dirname(args[0]):
+        # Resolve against the PATH the child will search, keeping argv[0].
+        path = env.get("PATH", os.defpath) if env is not None else os.environ.get("PATH")
+        resolved = _which_cached(args[0], path, os.environ.get("PATHEXT"))
+        if resolved is not None:
+            options["executable"] = resolved
+    return options
 
 
 @dataclass(frozen=True)
@@ -37,8 +98,14 @@ def run(
     check: bool = False,
     encoding: str = "utf-8",
     errors: str = "strict",
+    close_fds: bool | None = None,
 ) -> CompletedProcess:
-    """Execute *command* and capture its result."""
+    """Execute *command* and capture its result.
+
+    *close_fds* defaults to ``False`` on Linux so the child can be started
+    with ``posix_spawn``; pass ``True`` to close inherited descriptors as
+    :mod:`subprocess` does by default.
+    """
 
     if isinstance(command, str):
         shell = True
@@ -55,6 +122,7 @@ def run(
         timeout=timeout,
         capture_output=capture_output,
         text=False,
+        **_spawn_options(args, env, cwd, close_fds),
     )
     stdout = completed.stdout.decode(encoding, errors) if completed.stdout is not None else ""
     stderr = completed.stderr.decode(encoding, errors) if completed.stderr is not None else ""
@@ -76,8 +144,12 @@ def stream(
     env: Mapping[str, str] | None = None,
     encoding: str = "utf-8",
     errors: str = "replace",
+    close_fds: bool | None = None,
 ) -> Iterable[str]:
-    """Yield output lines from *command* as they become available."""
+    """Yield output lines from *command* as they become available.
+
+    *close_fds* behaves as in :func:`run`.
+    """
 
     if isinstance(command, str):
         proc = subprocess.Popen(  # noqa: S603 - intended invocation
@@ -87,30 +159,67 @@ def stream(
             env=dict(env) if env is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
+            **_spawn_options(command, env, cwd, close_fds),
         )
     else:
+        args = list(command)
         proc = subprocess.Popen(  # noqa: S603
-            list(command),
+            args,
             shell=False,
             cwd=cwd,
             env=dict(env) if env is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
+            **_spawn_options(args, env, cwd, close_fds),
         )
     assert proc.stdout is not None
-    for raw_line in iter(proc.stdout.readline, b""):
-        yield raw_line.decode(encoding, errors)
+    # Read whatever the pipe holds in one syscall and split it here, rather
+    # than going through the buffered reader's readline for every line.
+    fd = proc.stdout.fileno()
+    pending = bytearray()
+    while chunk := os.read(fd, _STREAM_CHUNK_SIZE):
+        pending += chunk
+        start = 0
+        while (newline := pending.find(b"\n", start)) >= 0:
+            yield pending[start : newline + 1].decode(encoding, errors)
+            start = newline + 1
+        del pending[:start]
+    if pending:
+        yield pending.decode(encoding, errors)
     proc.wait()
 
 
 def which(executable: str) -> str | None:
-    """Return the absolute path to *executable* when available."""
+    """Return the absolute path to *executable* when available.
+
+    Found paths are cached per ``PATH``/``PATHEXT`` value and re-checked on
+    each call; misses are never cached. The cache is cleared when
+    :func:`setEnv`, :func:`unsetEnv`, or :func:`temporary_env` change either
+    variable.
+    """
+
+    environ = os.environ
+    return _which_cached(executable, environ.get("PATH"), environ.get("PATHEXT"))
 
-    return shutil.which(executable)
 
+def env() -> Mapping[str, str]:
+    """Return a read-only snapshot of the current environment variables.
 
-def env() -> Dict[str, str]:
-    """Return a copy of the current environment variables."""
+    The snapshot is reused until :func:`setEnv`, :func:`unsetEnv`, or
+    :func:`temporary_env` change the environment; writes made directly to
+    :data:`os.environ` are not tracked. Use :func:`env_copy` for a mutable
+    dictionary.
+    """
+
+    global _env_snapshot
+    snapshot = _env_snapshot
+    if snapshot is None:
+        snapshot = _env_snapshot = MappingProxyType(dict(os.environ))
+    return snapshot
+
+
+def env_copy() -> Dict[str, str]:
+    """Return a mutable copy of the current environment variables."""
 
     return dict(os.environ)
 
@@ -119,13 +228,16 @@ def setEnv(mapping: Mapping[str, str]) -> None:
     """Update the current process environment with *mapping*."""
 
     os.environ.update(mapping)
+    _environment_changed(mapping)
 
 
 def unsetEnv(keys: Iterable[str]) -> None:
     """Remove the provided *keys* from the process environment."""
 
+    keys = list(keys)
     for key in keys:
         os.environ.pop(key, None)
+    _environment_changed(keys)
 
 
 def terminate(process: subprocess.Popen[bytes]) -> None:
@@ -148,8 +260,12 @@ def spawn(
     stdin: int | None = None,
     stdout: int | None = None,
     stderr: int | None = None,
+    close_fds: bool | None = None,
 ) -> subprocess.Popen[bytes]:
-    """Launch *command* returning the underlying :class:`subprocess.Popen`."""
+    """Launch *command* returning the underlying :class:`subprocess.Popen`.
+
+    *close_fds* behaves as in :func:`run`.
+    """
 
     if isinstance(command, str):
         return subprocess.Popen(  # noqa: S603 - caller controls command
@@ -160,22 +276,25 @@ def spawn(
             stdin=stdin,
             stdout=stdout,
             stderr=stderr,
+            **_spawn_options(command, env, cwd, close_fds),
         )
+    args = list(command)
     return subprocess.Popen(  # noqa: S603
-        list(command),
+        args,
         shell=False,
         cwd=cwd,
         env=dict(env) if env is not None else None,
         stdin=stdin,
         stdout=stdout,
         stderr=stderr,
+        **_spawn_options(args, env, cwd, close_fds),
     )
 
 
 def quote(args: Sequence[str]) -> str:
     """Return a shell-escaped string built from *args*."""
 
-    return " ".join(shlex.quote(part) for part in args)
+    return shlex.join(args)
 
 
 @contextmanager
@@ -183,14 +302,17 @@ def temporary_env(mapping: Mapping[str, str], *, clear: bool = False) -> Iterato
     """Temporarily modify the process environment."""
 
     original = dict(os.environ)
+    touched = original.keys() if clear else mapping.keys()
     try:
         if clear:
             os.environ.clear()
         os.environ.update(mapping)
+        _environment_changed(touched | mapping.keys())
         yield
     finally:
         os.environ.clear()
         os.environ.update(original)
+        _environment_changed(touched | mapping.keys())
 
 
 __all__ = [
@@ -199,6 +321,7 @@ __all__ = [
     "stream",
     "which",
     "env",
+    "env_copy",
     "setEnv",
     "unsetEnv",
     "terminate",
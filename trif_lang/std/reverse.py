@@ -1,10 +1,29 @@
 """Small helpers for reverse engineering workflows."""
 from __future__ import annotations
 
+import mmap
+import os
 import struct
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
+
+from . import _iouring
+
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+# e_shentsize, e_shnum, e_shstrndx
+_ELF_SH_COUNTS = struct.Struct("<HHH")
+# sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, sh_link, sh_info,
+# sh_addralign, sh_entsize
+_ELF64_SHDR = struct.Struct("<IIQQQQIIQQ")
+_ELF32_SHDR = struct.Struct("<IIIIIIIIII")
+# VirtualSize, VirtualAddress, SizeOfRawData, PointerToRawData
+_PE_SECTION = struct.Struct("<IIII")
+# Maps non-printable bytes to "." for the hexdump text column.
+_PRINTABLE = bytes(byte if 32 <= byte < 127 else 0x2E for byte in range(256))
+_OFFSET_PREFIX = "%08X  ".__mod__
 
 
 @dataclass
@@ -13,67 +32,132 @@ class ExecutableInfo:
     format: str
     sections: List[Dict[str, Any]]
 
+    def __getattr__(self, name: str) -> Any:
+        # ELF results from _inspect carry the raw section header table instead
+        # of ``sections``; the dicts are built, and names decoded, on first read.
+        if name == "sections":
+            table = self.__dict__.pop("_elf_section_table", None)
+            if table is not None:
+                self.sections = _build_elf_sections(*table)
+                return self.sections
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
 
 def inspectExecutable(path: str) -> ExecutableInfo:
-    data = Path(path).read_bytes()
-    if data.startswith(b"\x7fELF"):
-        return ExecutableInfo(path, "ELF", _parse_elf_sections(data))
-    if data.startswith(b"MZ"):
+    # The binary is memory-mapped so only the pages holding headers and the
+    # section name table are read; slicing the mmap copies just that slice.
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ExecutableInfo(path, "unknown", [])
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _inspect(path, data)
+
+
+def inspectExecutableMany(paths: Iterable[str]) -> List[ExecutableInfo]:
+    """Inspect every binary in *paths*, returning results in order.
+
+    With the optional ``liburing`` bindings on Linux and ``TRIF_IO_URING=1``
+    set, the files are read in io_uring batches, one submission per batch;
+    otherwise each path goes through :func:`inspectExecutable`.
+    """
+
+    paths = list(paths)
+    if len(paths) < 2 or not _iouring.available():
+        return [inspectExecutable(path) for path in paths]
+    results: List[ExecutableInfo] = []
+    # Parse batch by batch so only one batch of file contents is held at once.
+    for start in range(0, len(paths), _iouring.BATCH_SIZE):
+        batch = paths[start : start + _iouring.BATCH_SIZE]
+        results.extend(_inspect(path, data) for path, data in zip(batch, _iouring.read_many(batch)))
+    return results
+
+
+def _inspect(path: str, data: bytes | mmap.mmap) -> ExecutableInfo:
+    magic = data[:4]
+    if magic == b"\x7fELF":
+        info = ExecutableInfo.__new__(ExecutableInfo)
+        info.path, info.format = path, "ELF"
+        info.__dict__["_elf_section_table"] = _read_elf_section_table(data)
+        return info
+    if magic[:2] == b"MZ":
         return ExecutableInfo(path, "PE", _parse_pe_sections(data))
     return ExecutableInfo(path, "unknown", [])
 
 
 def hexdump(data: bytes, width: int = 16) -> str:
+    data = bytes(data)
+    # Both columns are rendered for the whole buffer in C, then sliced per
+    # line: every byte takes three characters of hex_text and one of text.
+    hex_text = data.hex(" ").upper()
+    text = data.translate(_PRINTABLE).decode("ascii")
+    hex_width = width * 3
+    size = len(data)
     lines: List[str] = []
-    for offset in range(0, len(data), width):
-        chunk = data[offset : offset + width]
-        hex_bytes = " ".join(f"{byte:02X}" for byte in chunk)
-        ascii_repr = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{offset:08X}  {hex_bytes:<{width * 3}}  {ascii_repr}")
+    append = lines.append
+    # Full lines need no padding: their hex slice plus the column gap is
+    # exactly hex_width + 2 characters.
+    full = size - size % width if width else 0
+    for offset in range(0, full, width):
+        start = offset * 3
+        append(_OFFSET_PREFIX(offset) + hex_text[start : start + hex_width - 1] + "   " + text[offset : offset + width])
+    if full < size:
+        hex_bytes = hex_text[full * 3 :]
+        append(_OFFSET_PREFIX(full) + hex_bytes + " " * (hex_width + 2 - len(hex_bytes)) + text[full:])
     return "\n".join(lines)
 
 
-def _parse_elf_sections(data: bytes) -> List[Dict[str, Any]]:
+def _read_elf_section_table(data: bytes | mmap.mmap) -> Tuple[bool, int, int, bytes, bytes]:
+    """Copy out the section header table and name table for _build_elf_sections."""
+
     is_64 = data[4] == 2
     if is_64:
-        e_shoff = struct.unpack_from("<Q", data, 40)[0]
-        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from("<HHH", data, 58)
-        header_fmt = "<IIQQQQIIQQ"
+        e_shoff = _U64.unpack_from(data, 40)[0]
+        e_shentsize, e_shnum, e_shstrndx = _ELF_SH_COUNTS.unpack_from(data, 58)
+        header_struct = _ELF64_SHDR
     else:
-        e_shoff = struct.unpack_from("<I", data, 32)[0]
-        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from("<HHH", data, 46)
-        header_fmt = "<IIIIIIIIII"
-
+        e_shoff = _U32.unpack_from(data, 32)[0]
+        e_shentsize, e_shnum, e_shstrndx = _ELF_SH_COUNTS.unpack_from(data, 46)
+        header_struct = _ELF32_SHDR
+
+    # sh_offset and sh_size sit at the same field positions in both layouts.
+    str_header = header_struct.unpack_from(data, e_shoff + e_shentsize * e_shstrndx)
+    str_offset, str_size = str_header[4], str_header[5]
+    str_table = bytes(data[str_offset : str_offset + str_size])
+
+    if not e_shnum:
+        return is_64, e_shentsize, 0, b"", str_table
+    # Headers sit at increasing offsets, so unpacking the last one now raises
+    # for a truncated table here rather than when sections is first read.
+    last = e_shoff + e_shentsize * (e_shnum - 1)
+    header_struct.unpack_from(data, last)
+    return is_64, e_shentsize, e_shnum, bytes(data[e_shoff : last + header_struct.size]), str_table
+
+
+def _build_elf_sections(
+    is_64: bool, entry_size: int, count: int, table: bytes, str_table: bytes
+) -> List[Dict[str, Any]]:
     sections: List[Dict[str, Any]] = []
-    str_hdr_offset = e_shoff + e_shentsize * e_shstrndx
-    if is_64:
-        _, _, _, _, _, _, _, _, str_offset, str_size = struct.unpack_from(header_fmt, data, str_hdr_offset)
-    else:
-        _, _, _, _, _, _, _, _, str_offset, str_size = struct.unpack_from(header_fmt, data, str_hdr_offset)
-    str_table = data[str_offset : str_offset + str_size]
-
-    for index in range(e_shnum):
-        offset = e_shoff + e_shentsize * index
-        header = struct.unpack_from(header_fmt, data, offset)
-        name_offset = header[0]
-        section_offset = header[4 if is_64 else 4]
-        section_size = header[5 if is_64 else 5]
-        name = _read_c_string(str_table, name_offset)
-        sections.append({"name": name, "offset": section_offset, "size": section_size})
+    append = sections.append
+    unpack_header = (_ELF64_SHDR if is_64 else _ELF32_SHDR).unpack_from
+    for index in range(count):
+        header = unpack_header(table, entry_size * index)
+        append({"name": _read_c_string(str_table, header[0]), "offset": header[4], "size": header[5]})
     return sections
 
 
-def _parse_pe_sections(data: bytes) -> List[Dict[str, Any]]:
-    pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
-    num_sections = struct.unpack_from("<H", data, pe_offset + 6)[0]
-    section_table = pe_offset + 24 + struct.unpack_from("<H", data, pe_offset + 20)[0]
+def _parse_pe_sections(data: bytes | mmap.mmap) -> List[Dict[str, Any]]:
+    pe_offset = _U32.unpack_from(data, 0x3C)[0]
+    num_sections = _U16.unpack_from(data, pe_offset + 6)[0]
+    section_table = pe_offset + 24 + _U16.unpack_from(data, pe_offset + 20)[0]
     sections: List[Dict[str, Any]] = []
+    append = sections.append
+    unpack_section = _PE_SECTION.unpack_from
     entry_size = 40
     for i in range(num_sections):
         entry = section_table + entry_size * i
         name = data[entry : entry + 8].split(b"\0", 1)[0].decode("ascii", errors="ignore")
-        virtual_size, virtual_address, size_of_raw, pointer_to_raw = struct.unpack_from("<IIII", data, entry + 8)
-        sections.append(
+        virtual_size, virtual_address, size_of_raw, pointer_to_raw = unpack_section(data, entry + 8)
+        append(
             {
                 "name": name,
                 "virtualSize": virtual_size,
@@ -92,4 +176,4 @@ def _read_c_string(blob: bytes, offset: int) -> str:
     return blob[offset:end].decode("utf-8", errors="ignore")
 
 
-__all__ = ["ExecutableInfo", "inspectExecutable", "hexdump"]
+__all__ = ["ExecutableInfo", "inspectExecutable", "inspectExecutableMany", "hexdump"]
@@ -1,7 +1,11 @@
 """Threading helpers for Trif."""
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
+import functools
+import inspect
+import os
 import time
 from typing import Any, Callable
 
@@ -13,12 +17,46 @@ def spawn(func: Callable[[], Any]) -> None:
 
 
 def parallel_map(func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
-    futures = [_executor.submit(func, item) for item in items]
-    return [future.result() for future in futures]
+    return list(_executor.map(func, items))
+
+
+async def parallel_map_async(func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """Await *func* over *items* concurrently, preserving order.
+
+    Coroutine functions run directly on the current event loop; plain
+    functions run on the loop's default executor so they may block without
+    stalling it.
+    """
+
+    if inspect.iscoroutinefunction(func):
+        calls = [func(item) for item in items]
+    else:
+        calls = [asyncio.to_thread(func, item) for item in items]
+    return list(await asyncio.gather(*calls))
+
+
+@functools.cache
+def _process_executor() -> concurrent.futures.ProcessPoolExecutor:
+    # Created on first use: starting worker processes is too costly to do at
+    # import time for programs that never need them.
+    return concurrent.futures.ProcessPoolExecutor()
+
+
+def parallel_map_cpu(func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """Map *func* over *items* in worker processes, preserving order.
+
+    Use this for CPU-bound work that the GIL would serialise under
+    :func:`parallel_map`. *func* and the items must be picklable; items are
+    sent to the workers in chunks to amortise the inter-process round trips.
+    """
+
+    items = list(items)
+    chunksize = max(1, len(items) // ((os.cpu_count() or 1) * 4))
+    return list(_process_executor().map(func, items, chunksize=chunksize))
 
 
 def sleep(seconds: float) -> None:
     time.sleep(seconds)
 
 
-__all__ = ["spawn", "parallel_map", "sleep"]
+__all__ = ["spawn", "parallel_map", "parallel_map_async", "parallel_map_cpu", "sleep"]
@@ -1,12 +1,28 @@
 """Client side web helpers."""
 from __future__ import annotations
 
+import functools
+import http.client
+import io
 import json
+import os
+import re
+import sys
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+_CHARSET_RE = re.compile(r"charset=([^\s;]+)", re.I)
+_MAX_REDIRECTS = 10  # urllib.request.HTTPRedirectHandler.max_redirections
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+# Idempotent methods (RFC 9110, section 9.2.2) that are safe to resend.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_USER_AGENT = "Python-urllib/%d.%d" % sys.version_info[:2]
+_pool = threading.local()
+_PAIR_CACHE_LIMIT = 256
 
 
 @dataclass(frozen=True)
@@ -17,15 +33,38 @@ class Response:
     status: int
     headers: Dict[str, str]
     body: bytes
+    # Decoded text per charset; the response is immutable so entries never go stale.
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _charset(self) -> str:
+        match = _CHARSET_RE.search(self.headers.get("Content-Type", ""))
+        return match.group(1) if match else "utf-8"
 
     def text(self, encoding: str | None = None) -> str:
-        charset = encoding or self.headers.get("Content-Type", "").split("charset=")[-1]
-        if not charset or "charset=" not in self.headers.get("Content-Type", ""):
-            charset = encoding or "utf-8"
-        return self.body.decode(charset, errors="replace")
+        charset = encoding or self._charset()
+        key = "text:" + charset
+        try:
+            return self._cache[key]
+        except KeyError:
+            text = self._cache[key] = self.body.decode(charset, errors="replace")
+            return text
 
     def json(self) -> Any:
-        return json.loads(self.text())
+        try:
+            return self._cache["json"]
+        except KeyError:
+            pass
+        value: Any
+        if self._charset().lower().replace("_", "-").startswith("utf-"):
+            # json.loads detects UTF-8/16/32 itself, skipping the intermediate str.
+            try:
+                value = json.loads(self.body)
+            except UnicodeDecodeError:
+                value = json.loads(self.text())
+        else:
+            value = json.loads(self.text())
+        self._cache["json"] = value
+        return value
 
 
 class _NoRedirect(urllib.request.HTTPErrorProcessor):
@@ -35,6 +74,110 @@ class _NoRedirect(urllib.request.HTTPErrorProcessor):
     https_response = http_response
 
 
+def _proxy_environment() -> Tuple[Tuple[str, str], ...]:
+    # Everything urllib.request.getproxies_environment() looks at; the caches
+    # below are keyed on it so changes to the variables take effect.
+    return tuple(
+        sorted(item for item in os.environ.items() if item[0].lower().endswith("_proxy") or item[0] == "REQUEST_METHOD")
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_opener(allow_redirects: bool, environment: Tuple[Tuple[str, str], ...]) -> urllib.request.OpenerDirector:
+    # build_opener instantiates the whole handler chain and reads the proxy
+    # configuration from the environment, so build each variant once.
+    return urllib.request.build_opener(*([] if allow_redirects else [_NoRedirect()]))
+
+
+def _opener(allow_redirects: bool) -> urllib.request.OpenerDirector:
+    return _cached_opener(allow_redirects, _proxy_environment())
+
+
+@functools.lru_cache(maxsize=2)
+def _proxies(environment: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    return urllib.request.getproxies()
+
+
+def _proxied(scheme: str, host: str) -> bool:
+    return scheme in _proxies(_proxy_environment()) and not urllib.request.proxy_bypass(host)
+
+
+def _connection(key: Tuple[str, str, int | None], timeout: float | None) -> Tuple[http.client.HTTPConnection, bool]:
+    # Connections are not thread-safe, so every thread keeps its own pool.
+    connections = _pool.__dict__.setdefault("connections", {})
+    conn = connections.get(key)
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    scheme, host, port = key
+    factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    conn = connections[key] = factory(host, port, timeout=timeout)
+    return conn, False
+
+
+def _discard(key: Tuple[str, str, int | None]) -> None:
+    conn = _pool.__dict__.get("connections", {}).pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+def _send(
+    key: Tuple[str, str, int | None],
+    method: str,
+    target: str,
+    payload: bytes | None,
+    headers: Dict[str, str],
+    timeout: float | None,
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    # A request that failed on a reused connection may still have reached the
+    # server, so only methods that are safe to repeat are retried.
+    retry = method in _IDEMPOTENT_METHODS
+    while True:
+        conn, reused = _connection(key, timeout)
+        try:
+            try:
+                conn.request(method, target, body=payload, headers=headers)
+            except OSError as exc:
+                if reused and retry and isinstance(exc, (ConnectionResetError, BrokenPipeError)):
+                    _discard(key)
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            response = conn.getresponse()
+            body = response.read()
+        except http.client.RemoteDisconnected:
+            # The server closed an idle keep-alive connection; retry once on
+            # a fresh one.
+            _discard(key)
+            if reused and retry:
+                continue
+            raise
+        except BaseException:
+            _discard(key)
+            raise
+        if response.will_close:
+            _discard(key)
+        return response, body
+
+
+def _fetch_urllib(
+    url: str,
+    method: str | None,
+    headers: Mapping[str, str],
+    payload: bytes | None,
+    timeout: float | None,
+    allow_redirects: bool,
+) -> Response:
+    request = urllib.request.Request(url, data=payload, method=method)
+    for key, value in headers.items():
+        request.add_header(key, value)
+    with _opener(allow_redirects).open(request, timeout=timeout) as response:
+        body = response.read()
+        header_map = {key: value for key, value in response.headers.items()}
+        return Response(response.geturl(), response.getcode(), header_map, body)
+
+
 def fetch(
     url: str,
     *,
@@ -44,35 +187,96 @@ def fetch(
     timeout: float | None = None,
     allow_redirects: bool = True,
 ) -> Response:
-    """Perform an HTTP request returning a :class:`Response`."""
+    """Perform an HTTP request returning a :class:`Response`.
+
+    Plain HTTP(S) requests reuse keep-alive connections held per thread and
+    host. Other schemes and proxied hosts go through :mod:`urllib.request`.
+    """
 
     payload: bytes | None
     if isinstance(data, Mapping):
-        payload = urllib.parse.urlencode(data).encode("utf-8")
+        payload = _url_encode(data).encode("utf-8")
         headers = {"Content-Type": "application/x-www-form-urlencoded", **(headers or {})}
     elif isinstance(data, str):
         payload = data.encode("utf-8")
     else:
         payload = data
 
-    request = urllib.request.Request(url, data=payload, method=method)
-    if headers:
-        for key, value in headers.items():
-            request.add_header(key, value)
-    handlers = []
-    if not allow_redirects:
-        handlers.append(_NoRedirect())
-    handler = urllib.request.build_opener(*handlers)
-    with handler.open(request, timeout=timeout) as response:
-        body = response.read()
-        header_map = {key: value for key, value in response.headers.items()}
-        return Response(response.geturl(), response.getcode(), header_map, body)
+    # Mirror urllib.request: capitalised header names, its default
+    # User-Agent, and a form Content-Type for bodies that lack one.
+    request_headers = {"User-Agent": _USER_AGENT}
+    if payload is not None:
+        request_headers["Content-type"] = "application/x-www-form-urlencoded"
+    for key, value in (headers or {}).items():
+        request_headers[key.capitalize()] = value
+    request_method = (method or ("POST" if payload is not None else "GET")).upper()
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname or _proxied(scheme, parts.hostname):
+            return _fetch_urllib(url, request_method, request_headers, payload, timeout, allow_redirects)
+        target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+        response, body = _send(
+            (scheme, parts.hostname, parts.port), request_method, target, payload, request_headers, timeout
+        )
+        status = response.status
+        location = response.headers.get("Location") or response.headers.get("URI")
+        if not (allow_redirects and status in _REDIRECT_CODES and location):
+            break
+        # Same rules as urllib.request.HTTPRedirectHandler: only GET/HEAD
+        # follow every redirect, POST follows 301-303 as a GET.
+        if not (request_method in ("GET", "HEAD") or (request_method == "POST" and status in (301, 302, 303))):
+            break
+        url = urllib.parse.urljoin(url, location.replace(" ", "%20"))
+        if urllib.parse.urlsplit(url).scheme.lower() not in ("http", "https", "ftp"):
+            break
+        request_method = "HEAD" if request_method == "HEAD" else "GET"
+        payload = None
+        request_headers = {
+            key: value for key, value in request_headers.items() if key.lower() not in ("content-length", "content-type")
+        }
+    else:
+        raise urllib.error.HTTPError(
+            url, status, "The HTTP server returned a redirect error that would lead to an infinite loop.",
+            response.msg, io.BytesIO(body),
+        )
+
+    if allow_redirects and not 200 <= status < 300:
+        # urllib raises for error statuses unless redirect handling is off.
+        raise urllib.error.HTTPError(url, status, response.reason, response.msg, io.BytesIO(body))
+    return Response(url, status, dict(response.headers.items()), body)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_pair(key: str | bytes, value: str | bytes) -> str:
+    return urllib.parse.quote_plus(key) + "=" + urllib.parse.quote_plus(value)
+
+
+def _encode_pair(key: Any, value: Any) -> str:
+    # Same conversions as urllib.parse.urlencode; repeated pairs (API keys,
+    # versions, tokens) are quoted once. Long values are rarely repeated, so
+    # they skip the cache instead of evicting useful entries.
+    key = key if isinstance(key, (str, bytes)) else str(key)
+    value = value if isinstance(value, (str, bytes)) else str(value)
+    if len(value) > _PAIR_CACHE_LIMIT:
+        return urllib.parse.quote_plus(key) + "=" + urllib.parse.quote_plus(value)
+    return _quote_pair(key, value)
+
+
+def _url_encode(data: Mapping[str, str] | Iterable[tuple[str, str]]) -> str:
+    items = data.items() if isinstance(data, Mapping) else data
+    try:
+        return "&".join([_encode_pair(key, value) for key, value in items])
+    except (TypeError, ValueError):
+        # Let urlencode report unsupported input with its usual message.
+        return urllib.parse.urlencode(data)  # type: ignore[arg-type]
 
 
 def urlEncode(data: Mapping[str, str] | Iterable[tuple[str, str]]) -> str:
     """Return a URL encoded query string."""
 
-    return urllib.parse.urlencode(data)
+    return _url_encode(data)
 
 
 def joinUrl(base: str, *parts: str, query: Mapping[str, str] | None = None) -> str:
@@ -80,7 +284,7 @@ def joinUrl(base: str, *parts: str, query: Mapping[str, str] | None = None) -> s
 
     parsed = urllib.parse.urlparse(base)
     path = "/".join(filter(None, [parsed.path.rstrip("/")] + [part.strip("/") for part in parts]))
-    query_string = urllib.parse.urlencode(query) if query else parsed.query
+    query_string = _url_encode(query) if query else parsed.query
     rebuilt = parsed._replace(path=path, query=query_string)
     return urllib.parse.urlunparse(rebuilt)
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Sequence, Set
 
 from .compiler import Compiler
 from .package_manager import PackageManager
@@ -43,6 +43,8 @@ class Toolchain:
         self.runtime = Runtime()
         self.package_manager = PackageManager(project_root=self.project_root)
         self.runtime.prepare_project_environment(self.project_root)
+        # Directories created by earlier builds; repeated builds skip the mkdir calls.
+        self._created_dirs: Set[Path] = set()
 
     # ------------------------------------------------------------------
     # Build pipeline
@@ -57,36 +59,34 @@ class Toolchain:
         opts = options or BuildOptions()
         targets = self._normalize_targets(opts.targets)
         build_root = self.resolve_build_directory(opts.build_dir)
-        build_root.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(build_root)
 
         source_path = self._resolve_source(source)
         if not source_path.exists():
             raise FileNotFoundError(f"Source file {source_path} does not exist")
 
+        relative_base = self._relative_to_project(source_path)
+        outputs = [
+            (target, build_root / target / relative_base.with_suffix(_VALID_TARGETS[target])) for target in targets
+        ]
         artifacts: List[BuildArtifact] = []
-        for target in targets:
-            extension = _VALID_TARGETS[target]
-            target_dir = build_root / target
-            target_dir.mkdir(parents=True, exist_ok=True)
-            relative = self._relative_to_project(source_path).with_suffix(extension)
-            output_path = target_dir / relative
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        for target, output_path in outputs:
+            self._ensure_directory(output_path.parent)
 
             compiled = self.compiler.compile_file(source_path, target=target, optimize=opts.optimize)
             if target == "bytecode":
                 assert isinstance(compiled, (bytes, bytearray))
                 data = bytes(compiled)
-                output_path.write_bytes(data)
-                size = len(data)
             else:
                 assert isinstance(compiled, str)
                 text = compiled
                 if opts.encrypt:
                     text = self.compiler.encrypt_output(text, opts.encrypt)
-                output_path.write_text(text, encoding="utf-8")
-                size = len(text.encode("utf-8"))
+                # Encode once; the byte length doubles as the artifact size.
+                data = text.encode("utf-8")
+            self._write_output(output_path, data)
 
-            artifacts.append(BuildArtifact(target=target, path=output_path, size=size))
+            artifacts.append(BuildArtifact(target=target, path=output_path, size=len(data)))
 
         return artifacts
 
@@ -102,27 +102,24 @@ class Toolchain:
 
         header = ("Target", "Output", "Size")
         rows: List[tuple[str, str, str]] = [header]
+        target_width, path_width, size_width = map(len, header)
         for artifact in artifacts:
             output_path = artifact.path
             try:
                 display_path = output_path.relative_to(self.project_root)
             except ValueError:
                 display_path = output_path
-            rows.append(
-                (
-                    artifact.target,
-                    str(display_path),
-                    self._format_size(artifact.size),
-                )
-            )
-
-        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
-        lines: List[str] = []
-        for idx, row in enumerate(rows):
-            padded = [row[i].ljust(widths[i]) for i in range(len(header))]
-            lines.append("  ".join(padded))
-            if idx == 0:
-                lines.append("  ".join("-" * width for width in widths))
+            row = (artifact.target, str(display_path), self._format_size(artifact.size))
+            rows.append(row)
+            target_width = max(target_width, len(row[0]))
+            path_width = max(path_width, len(row[1]))
+            size_width = max(size_width, len(row[2]))
+
+        widths = (target_width, path_width, size_width)
+        lines = [
+            f"{target:<{target_width}}  {path:<{path_width}}  {size:<{size_width}}" for target, path, size in rows
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
         return "\n".join(lines)
 
     # ------------------------------------------------------------------
@@ -138,13 +135,27 @@ class Toolchain:
     def _normalize_targets(self, targets: Sequence[str]) -> List[str]:
         if not targets:
             return ["python"]
-        unique: List[str] = []
-        for target in targets:
-            if target not in _VALID_TARGETS:
-                raise ValueError(f"Unknown target '{target}'")
-            if target not in unique:
-                unique.append(target)
-        return unique
+        unique = dict.fromkeys(targets)
+        unknown = unique.keys() - _VALID_TARGETS.keys()
+        if unknown:
+            # Report the first unknown target in the order it was given.
+            first = next(target for target in unique if target in unknown)
+            raise ValueError(f"Unknown target '{first}'")
+        return list(unique)
+
+    def _ensure_directory(self, path: Path) -> None:
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _write_output(self, path: Path, data: bytes) -> None:
+        try:
+            path.write_bytes(data)
+        except FileNotFoundError:
+            # The output directory was removed after it was cached; recreate it.
+            self._created_dirs.clear()
+            self._ensure_directory(path.parent)
+            path.write_bytes(data)
 
     def _resolve_source(self, source: Path) -> Path:
         candidate = Path(source)